@@ -0,0 +1,102 @@
+import json
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, List, Tuple
+
+import requests
+
+from creatio_tests.field_types import FieldType
+from creatio_tests.page.page_object import PageObject
+from creatio_tests.services.data_client import CreatioDataClient
+from creatio_tests.utils.page_loader import load_page_config
+
+from .stub_server import ODATA_PAGE_SIZE, StubServer, option_values
+
+
+GUID_A = "11111111-1111-1111-1111-111111111111"
+GUID_B = "22222222-2222-2222-2222-222222222222"
+
+
+def http_client(server: StubServer):
+    session = requests.Session()
+    resp = session.post(
+        f"{server.base_url}/ServiceModel/AuthService.svc/Login",
+        json={"UserName": "Supervisor", "UserPassword": "Supervisor"},
+        timeout=10,
+    )
+    resp.raise_for_status()
+    return SimpleNamespace(base_url=server.base_url, data=CreatioDataClient(session, server.base_url, batch_size=1), tracer=None)
+
+
+def check_verify_persisted(server: StubServer) -> Tuple[bool, str]:
+    server.put_record("Contact", {"Id": GUID_A, "Name": "Ann", "Age": 30, "Active": True, "Account": {"Name": "Acme"}})
+    server.put_record("Contact", {"Id": GUID_B, "Name": "Bob", "Age": 41, "Active": False, "Account": None})
+    client = http_client(server)
+    page = PageObject("Contact", client)
+    page.add_field(FieldType.LOOKUP, "AccountField", None, None, False, column="Account.Name")
+    before = server.odata_requests
+    ok, results = page.verify_persisted("Contact", {
+        GUID_A: {"Name": "Ann", "Age": "30", "Active": "1", "AccountField": "Acme"},
+        GUID_B: {"Name": "Bob", "Age": 41, "Active": "false", "AccountField": ""},
+    })
+    if not ok:
+        return False, f"expected all values to match: {results}"
+    if server.odata_requests - before != 2:
+        return False, f"expected one request per batch, got {server.odata_requests - before}"
+    ok, results = page.verify_persisted("Contact", {GUID_A: {"Active": "0"}, "33333333-3333-3333-3333-333333333333": {"Name": "Cy"}})
+    if ok or results[GUID_A]["Active"].ok or "not found" not in results["33333333-3333-3333-3333-333333333333"]["Name"].message:
+        return False, f"expected a mismatch and a missing record: {results}"
+    server.put_record("Invoice", {"Id": 5, "Number": "INV-5"})
+    server.put_record("Invoice", {"Id": 7, "Number": "INV-7"})
+    ok, results = page.verify_persisted("Invoice", {5: {"Number": "INV-5"}, 7: {"Number": "INV-7"}})
+    if not ok or server.last_odata_filter != "Id eq 7":
+        return False, f"numeric keys: expected unquoted 'Id eq 7', got {server.last_odata_filter!r}: {results}"
+    return True, "verify_persisted matches, mismatches, missing records and numeric keys"
+
+
+def check_fetch_column(server: StubServer) -> Tuple[bool, str]:
+    client = http_client(server)
+    options = client.data.fetch_column("AccountType", "Name")
+    expected = option_values(server.httpd.options)
+    if options != expected:
+        return False, f"expected {len(expected)} options across pages, got {len(options)}"
+    page = PageObject("Account", client)
+    page.add_field(FieldType.LOOKUP, "Type", None, None, False, lookup_values=[expected[0], expected[-1]], lookup_source={"entity": "AccountType"})
+    ok, fetched, msg = page.fields["Type"]._read_data_source()
+    if not ok or fetched != expected:
+        return False, f"lookup data source read failed: {msg}"
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bad.page.json"
+        path.write_text(json.dumps({"fields": [{"type": "TEXT", "code": "Name", "lookup_source": {"entity": "Contact"}}]}), encoding="utf-8")
+        try:
+            load_page_config(client, str(path))
+        except ValueError:
+            pass
+        else:
+            return False, "lookup_source on a TEXT field was accepted"
+    return True, f"fetch_column paged {len(options)} options; lookup_source rejected on non-lookup fields"
+
+
+CHECKS: List[Tuple[str, Callable[[StubServer], Tuple[bool, str]]]] = [
+    ("fetch_column", check_fetch_column),
+    ("verify_persisted", check_verify_persisted),
+]
+
+
+def main(argv=None) -> int:
+    failed = 0
+    with StubServer(options=ODATA_PAGE_SIZE * 2 + 5) as server:
+        for name, check in CHECKS:
+            try:
+                ok, msg = check(server)
+            except Exception as e:
+                ok, msg = False, f"{type(e).__name__}: {e}"
+            failed += 0 if ok else 1
+            print(f"{'PASS' if ok else 'FAIL'} {name}: {msg}", flush=True)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
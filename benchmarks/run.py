@@ -0,0 +1,132 @@
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from creatio_tests.utils.auth_loader import load_auth
+from creatio_tests.utils.page_loader import load_page_config
+
+from .stub_server import StubServer, option_values, stub_fields
+
+
+def write_configs(workdir: Path, base_url: str, fields: int, options: int, delay_ms: int, headless: bool) -> Dict[str, str]:
+    auth = {
+        "base_url": base_url,
+        "username": "Supervisor",
+        "password": "Supervisor",
+        "test_url": f"/page?fields={fields}&options={options}&delay={delay_ms}",
+        "headless": headless,
+        "wait_timeout_sec": 60,
+        "debug": False,
+    }
+    values = option_values(options)
+    page_fields = []
+    for f in stub_fields(fields, options):
+        item = {
+            "type": f["type"],
+            "code": f["code"],
+            "title": f["title"],
+            "readonly": f["readonly"],
+            "required": f["required"],
+            "strict_title": True,
+        }
+        if f["type"] == "LOOKUP":
+            item["lookup_values"] = [values[0], values[len(values) // 2], values[-1]]
+        page_fields.append(item)
+    page = {"name": f"Stub_{fields}", "wait_timeout_sec": 30, "debug": False, "fields": page_fields}
+    auth_path = workdir / f"stub_{fields}.auth.json"
+    page_path = workdir / f"stub_{fields}.page.json"
+    auth_path.write_text(json.dumps(auth), encoding="utf-8")
+    page_path.write_text(json.dumps(page), encoding="utf-8")
+    return {"auth": str(auth_path), "page": str(page_path)}
+
+
+def measure(client, name: str, fn: Callable, rows: List[Dict]):
+    client.tracer.reset()
+    start = time.perf_counter()
+    value = fn()
+    elapsed = time.perf_counter() - start
+    rows.append({"step": name, "elapsed_sec": round(elapsed, 4), "round_trips": client.tracer.report()["total_round_trips"]})
+    return value
+
+
+def run_size(
+    base_url: str,
+    workdir: Path,
+    fields: int,
+    options: int,
+    delay_ms: int,
+    headless: bool,
+    one_shot: bool,
+    backends: Optional[List[str]] = None,
+) -> Dict:
+    cfg = write_configs(workdir, base_url, fields, options, delay_ms, headless)
+    rows: List[Dict] = []
+    start = time.perf_counter()
+    client = load_auth(cfg["auth"])
+    rows.append({"step": "load_auth", "elapsed_sec": round(time.perf_counter() - start, 4), "round_trips": 0})
+    client.enable_tracing()
+    try:
+        measure(client, "login", client.login, rows)
+        measure(client, "load_page", client.load_page, rows)
+        measure(client, "build_fields_index", lambda: client.build_fields_index(one_shot=one_shot), rows)
+        page = measure(client, "load_page_config", lambda: load_page_config(client, cfg["page"]), rows)
+        ok_live, _ = measure(client, "check_all", page.check_all, rows)
+        ok_snap, _ = measure(client, "check_all(snapshot)", lambda: page.check_all(use_snapshot=True), rows)
+        ok_await, _ = measure(client, "await_check_all", page.await_check_all, rows)
+        await_report = client.tracer.report(top=5)
+        ok = {"check_all": ok_live, "check_all(snapshot)": ok_snap, "await_check_all": ok_await}
+        for backend in backends or []:
+            client.reader_backend = backend
+            ok[f"check_all(snapshot)[{backend}]"] = measure(client, f"snapshot[{backend}]", lambda: page.check_all(use_snapshot=True), rows)[0]
+            ok[f"check_titles[{backend}]"] = measure(client, f"titles[{backend}]", page.check_titles, rows)[0]
+            ok[f"check_readonly_all[{backend}]"] = measure(client, f"readonly[{backend}]", page.check_readonly_all, rows)[0]
+    finally:
+        client.close()
+    return {
+        "fields": fields,
+        "indexed": len(client.fields),
+        "ok": ok,
+        "steps": rows,
+        "load_stats": client.last_load_stats,
+        "await_check_all_report": await_report,
+    }
+
+
+def format_results(results: List[Dict]) -> str:
+    lines = []
+    for r in results:
+        lines.append(f"== {r['fields']} fields (indexed {r['indexed']}) ok={r['ok']}")
+        for s in r["steps"]:
+            lines.append(f"  {s['step']:<22} {s['elapsed_sec']:>10.3f}s {s['round_trips']:>8} round trips")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark creatio_tests against a local Creatio stand-in page")
+    ap.add_argument("--sizes", default="10,100,1000", help="comma-separated field counts")
+    ap.add_argument("--options", type=int, default=200, help="options per lookup dictionary")
+    ap.add_argument("--delay", type=int, default=0, help="render delay between field batches, ms")
+    ap.add_argument("--headed", action="store_true", help="run Chrome with a visible window")
+    ap.add_argument("--poll-index", action="store_true", help="use the polling build_fields_index path")
+    ap.add_argument("--backends", default="webdriver,cdp", help="comma-separated read backends to compare (webdriver, cdp); empty to skip")
+    ap.add_argument("--json", default=None, help="write raw results to this file")
+    args = ap.parse_args(argv)
+
+    sizes = [int(x) for x in args.sizes.split(",") if x.strip()]
+    backends = [x.strip() for x in args.backends.split(",") if x.strip()]
+    results = []
+    with StubServer(options=args.options) as server, tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            results.append(run_size(server.base_url, Path(tmp), n, args.options, args.delay, not args.headed, not args.poll_index, backends))
+            print(format_results(results[-1:]), flush=True)
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0 if all(all(r["ok"].values()) for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,372 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+FIELD_TAGS = {
+    "TEXT": "crt-input",
+    "NUMBER": "crt-number-input",
+    "BOOLEAN": "crt-checkbox",
+    "DATETIME": "crt-date-time-input",
+    "LOOKUP": "crt-combobox",
+}
+
+FIELD_CYCLE = ["TEXT", "NUMBER", "BOOLEAN", "DATETIME", "LOOKUP"]
+
+AUTH_COOKIE = ".ASPXAUTH"
+CSRF_COOKIE = "BPMCSRF"
+ODATA_PAGE_SIZE = 100
+ODATA_ID_FILTER_RE = re.compile(r"Id eq ('(?:[^']|'')*'|[0-9a-fA-F-]{36}|\d+)")
+ODATA_EXPAND_RE = re.compile(r"(\w+)\(\$select=([\w,]+)\)")
+
+
+def stub_fields(count: int, options: int = 50) -> List[Dict]:
+    out = []
+    for i in range(1, count + 1):
+        ftype = FIELD_CYCLE[(i - 1) % len(FIELD_CYCLE)]
+        f = {
+            "type": ftype,
+            "code": f"Field_{i}",
+            "title": f"Field {i}",
+            "required": i % 7 == 0,
+            "readonly": i % 11 == 0,
+        }
+        if ftype == "LOOKUP":
+            f["options"] = options
+        out.append(f)
+    return out
+
+
+def option_values(count: int) -> List[str]:
+    return [f"Value {i}" for i in range(1, count + 1)]
+
+
+PAGE_HTML = """<!doctype html>
+<html><head><meta charset="utf-8"><title>Creatio stand-in</title>
+<style>
+body { font-family: sans-serif; }
+.cdk-overlay-container { position: fixed; top: 0; right: 0; width: 320px; z-index: 1000; }
+.mat-autocomplete-panel { height: 256px; overflow-y: auto; background: #fff; border: 1px solid #ccc; }
+.mat-autocomplete-panel .crt-spacer { position: relative; }
+.mat-option { position: absolute; left: 0; right: 0; height: 48px; line-height: 48px; cursor: pointer; }
+.mat-error { color: #c00; }
+</style></head>
+<body>
+<div class="crt-shell" data-component="crt-shell"><div id="fields"></div></div>
+<div class="cdk-overlay-container"></div>
+<script>
+var CFG = __CONFIG__;
+var ITEM_H = 48, VIEW_H = 256;
+var overlay = document.querySelector('.cdk-overlay-container');
+var current = null;
+
+function values(n){ var out = []; for (var i = 1; i <= n; i++) out.push('Value ' + i); return out; }
+
+function closePanel(){
+  if (!current) return;
+  overlay.innerHTML = '';
+  current = null;
+}
+
+function renderOptions(){
+  if (!current) return;
+  var q = current.filter.toLowerCase();
+  var list = current.values.filter(function(v){ return !q || v.toLowerCase().indexOf(q) >= 0; });
+  var panel = current.panel, spacer = current.spacer;
+  spacer.style.height = (list.length * ITEM_H) + 'px';
+  var first = Math.max(0, Math.floor(panel.scrollTop / ITEM_H) - 2);
+  var last = Math.min(list.length, first + Math.ceil(VIEW_H / ITEM_H) + 4);
+  spacer.innerHTML = '';
+  for (var i = first; i < last; i++) {
+    var o = document.createElement('mat-option');
+    o.className = 'mat-option';
+    o.setAttribute('role', 'option');
+    o.style.top = (i * ITEM_H) + 'px';
+    var span = document.createElement('span');
+    span.className = 'mat-option-text';
+    span.textContent = list[i];
+    o.appendChild(span);
+    o.addEventListener('click', selectOption.bind(null, list[i]));
+    spacer.appendChild(o);
+  }
+}
+
+function selectOption(text){
+  if (!current) return;
+  current.input.value = text;
+  current.input.dispatchEvent(new Event('change', {bubbles: true}));
+  closePanel();
+}
+
+function openPanel(input, f){
+  if (current && current.input === input) return;
+  closePanel();
+  var pane = document.createElement('div');
+  pane.className = 'cdk-overlay-pane';
+  var panel = document.createElement('div');
+  panel.className = 'mat-autocomplete-panel mat-autocomplete-visible';
+  panel.setAttribute('role', 'listbox');
+  panel.tabIndex = 0;
+  var spacer = document.createElement('div');
+  spacer.className = 'crt-spacer';
+  panel.appendChild(spacer);
+  pane.appendChild(panel);
+  current = {input: input, panel: panel, spacer: spacer, values: values(f.options || 0), filter: ''};
+  panel.addEventListener('scroll', renderOptions);
+  setTimeout(function(){ overlay.appendChild(pane); renderOptions(); }, CFG.overlay_delay_ms);
+}
+
+function subscript(wrapper, input, f){
+  var sub = document.createElement('div');
+  sub.className = 'mat-form-field-subscript-wrapper';
+  wrapper.appendChild(sub);
+  input.addEventListener('blur', function(){
+    var invalid = f.required && !input.value;
+    input.setAttribute('aria-invalid', invalid ? 'true' : 'false');
+    sub.innerHTML = invalid ? '<mat-error class="mat-error">Field is required</mat-error>' : '';
+  });
+}
+
+function renderField(f, i){
+  var host = document.createElement(CFG.tags[f.type]);
+  host.setAttribute('element-name', f.code);
+  var wrapper = document.createElement('div');
+  wrapper.className = 'mat-form-field';
+  var label = document.createElement('label');
+  label.className = (f.type === 'BOOLEAN' ? 'crt-checkbox-label' : 'crt-input-label') + (f.required ? ' crt-input-required' : '');
+  label.textContent = f.title;
+  label.htmlFor = 'inp_' + i;
+  wrapper.appendChild(label);
+  var input = document.createElement('input');
+  input.id = 'inp_' + i;
+  if (f.type === 'BOOLEAN') {
+    var box = document.createElement('mat-checkbox');
+    input.type = 'checkbox';
+    box.appendChild(input);
+    wrapper.appendChild(box);
+  } else if (f.type === 'LOOKUP') {
+    var cont = document.createElement('div');
+    cont.className = 'crt-combobox-container';
+    input.setAttribute('role', 'combobox');
+    input.className = 'crt-autocomplete-input-control';
+    var caret = document.createElement('mat-icon');
+    caret.setAttribute('svgicon', 'caret-arrow');
+    caret.addEventListener('click', function(){ openPanel(input, f); });
+    input.addEventListener('input', function(){
+      openPanel(input, f);
+      current.filter = input.value;
+      current.panel.scrollTop = 0;
+      renderOptions();
+    });
+    cont.appendChild(input);
+    cont.appendChild(caret);
+    wrapper.appendChild(cont);
+  } else {
+    input.type = 'text';
+    input.className = 'mat-input-element';
+    input.setAttribute('matinput', '');
+    if (f.type === 'NUMBER') input.setAttribute('crtnumbercontrol', '');
+    if (f.type === 'DATETIME') { input.setAttribute('aria-haspopup', 'dialog'); input.className += ' crt-picker-input-control'; }
+    wrapper.appendChild(input);
+  }
+  if (f.readonly) { input.setAttribute('readonly', 'true'); host.setAttribute('readonly', 'true'); }
+  if (f.required) input.setAttribute('aria-required', 'true');
+  subscript(wrapper, input, f);
+  host.appendChild(wrapper);
+  return host;
+}
+
+document.body.addEventListener('keydown', function(e){ if (e.key === 'Escape') closePanel(); });
+
+function renderBatch(start){
+  var root = document.getElementById('fields');
+  var end = Math.min(CFG.fields.length, start + CFG.batch);
+  for (var i = start; i < end; i++) root.appendChild(renderField(CFG.fields[i], i));
+  if (end < CFG.fields.length) setTimeout(function(){ renderBatch(end); }, CFG.delay_ms);
+}
+setTimeout(function(){ renderBatch(0); }, CFG.delay_ms);
+</script>
+</body></html>
+"""
+
+
+def render_page(fields: int, options: int, delay_ms: int = 0, batch: Optional[int] = None, overlay_delay_ms: int = 0) -> str:
+    cfg = {
+        "fields": stub_fields(fields, options),
+        "tags": FIELD_TAGS,
+        "delay_ms": max(0, delay_ms),
+        "batch": max(1, batch or fields or 1),
+        "overlay_delay_ms": max(0, overlay_delay_ms),
+    }
+    return PAGE_HTML.replace("__CONFIG__", json.dumps(cfg))
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server_version = "CreatioStub/1.0"
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _cookies(self) -> Dict[str, str]:
+        out = {}
+        for part in (self.headers.get("Cookie") or "").split(";"):
+            if "=" in part:
+                k, v = part.strip().split("=", 1)
+                out[k] = v
+        return out
+
+    def _authenticated(self) -> bool:
+        return self._cookies().get(AUTH_COOKIE) == self.server.auth_token
+
+    def _send(self, status: int, body: str, content_type: str = "application/json", headers: Optional[Dict[str, str]] = None):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length).decode("utf-8"))
+        except Exception:
+            return {}
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        if path.endswith("/ServiceModel/AuthService.svc/Login"):
+            body = self._read_json()
+            self.server.login_count += 1
+            if body.get("UserName") != self.server.username or body.get("UserPassword") != self.server.password:
+                self._send(200, json.dumps({"Code": 1, "Message": "invalid credentials"}))
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Set-Cookie", f"{AUTH_COOKIE}={self.server.auth_token}; Path=/")
+            self.send_header("Set-Cookie", f"{CSRF_COOKIE}=stub-csrf; Path=/")
+            payload = json.dumps({"Code": 0}).encode("utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+            return
+        if path.endswith("/UserInfoService.svc/getCurrentUserInfo"):
+            if self._authenticated():
+                self._send(200, json.dumps({"UserName": self.server.username}))
+            else:
+                self._send(401, json.dumps({"Message": "unauthorized"}))
+            return
+        self._send(404, json.dumps({"Message": "not found"}))
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        q = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        if url.path == "/page":
+            html = render_page(
+                fields=int(q.get("fields", 10)),
+                options=int(q.get("options", 50)),
+                delay_ms=int(q.get("delay", 0)),
+                batch=int(q["batch"]) if "batch" in q else None,
+                overlay_delay_ms=int(q.get("overlay_delay", 0)),
+            )
+            self._send(200, html, content_type="text/html")
+            return
+        if url.path.startswith("/0/odata/"):
+            if not self._authenticated():
+                self._send(401, json.dumps({"Message": "unauthorized"}))
+                return
+            self._odata(url.path[len("/0/odata/"):], q)
+            return
+        self._send(200, "<!doctype html><html><body>stub</body></html>", content_type="text/html")
+
+    def _odata(self, entity: str, q: Dict[str, str]):
+        if entity in self.server.records:
+            self._odata_records(entity, q)
+            return
+        rows = [{"Id": f"{entity}-{i}", "Name": v} for i, v in enumerate(option_values(self.server.options), 1)]
+        skip = int(q.get("$skip", 0))
+        page = rows[skip:skip + ODATA_PAGE_SIZE]
+        select = [c.strip() for c in q.get("$select", "").split(",") if c.strip()]
+        if select:
+            page = [{k: r.get(k) for k in select} for r in page]
+        body = {"value": page}
+        if skip + ODATA_PAGE_SIZE < len(rows):
+            body["@odata.nextLink"] = f"/0/odata/{entity}?$select={','.join(select)}&$skip={skip + ODATA_PAGE_SIZE}"
+        self._send(200, json.dumps(body))
+
+    def _odata_records(self, entity: str, q: Dict[str, str]):
+        self.server.odata_requests += 1
+        table = self.server.records[entity]
+        flt = q.get("$filter", "")
+        self.server.last_odata_filter = flt
+        if flt:
+            ids = {m.strip("'").lower() for m in ODATA_ID_FILTER_RE.findall(flt)}
+            rows = [r for r in table.values() if str(r.get("Id")).lower() in ids]
+        else:
+            rows = list(table.values())
+        select = [c.strip() for c in q.get("$select", "").split(",") if c.strip()]
+        expand = {m.group(1): m.group(2).split(",") for m in ODATA_EXPAND_RE.finditer(q.get("$expand", ""))}
+        out = []
+        for r in rows:
+            item = {k: r.get(k) for k in select} if select else dict(r)
+            for nav, cols in expand.items():
+                item[nav] = {c: (r.get(nav) or {}).get(c) for c in cols} if r.get(nav) is not None else None
+            out.append(item)
+        self._send(200, json.dumps({"value": out}))
+
+
+class StubServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, username: str = "Supervisor", password: str = "Supervisor", options: int = 50):
+        self.httpd = ThreadingHTTPServer((host, port), StubHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.username = username
+        self.httpd.password = password
+        self.httpd.options = options
+        self.httpd.auth_token = "stub-session"
+        self.httpd.login_count = 0
+        self.httpd.records: Dict[str, Dict[str, Dict]] = {}
+        self.httpd.odata_requests = 0
+        self.httpd.last_odata_filter = ""
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def login_count(self) -> int:
+        return self.httpd.login_count
+
+    @property
+    def odata_requests(self) -> int:
+        return self.httpd.odata_requests
+
+    @property
+    def last_odata_filter(self) -> str:
+        return self.httpd.last_odata_filter
+
+    def put_record(self, entity: str, row: Dict):
+        self.httpd.records.setdefault(entity, {})[str(row["Id"])] = dict(row)
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,36 @@
+import argparse
+import sys
+
+from .utils.suite_runner import CHECK_MODES, DEFAULT_HISTORY_PATH, discover, run_suite
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m creatio_tests")
+    sub = ap.add_subparsers(dest="command", required=True)
+    run = sub.add_parser("run", help="run page configs across worker processes")
+    run.add_argument("paths", nargs="*", default=["."], help="page configs or directories to search")
+    run.add_argument("--pattern", default="*.page.json", help="page config glob used inside directories")
+    run.add_argument("--auth", default=None, help="auth config for every page (default: <name>.auth.json or nearest auth.json)")
+    run.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    run.add_argument("--mode", choices=CHECK_MODES, default="await", help="await_check_all, check_all or snapshot check_all")
+    run.add_argument("--report-dir", default="creatio_report", help="directory for results.jsonl, report.json and junit.xml")
+    run.add_argument("--spa", action="store_true", help="reuse one session per auth config and switch pages by in-app navigation")
+    run.add_argument("--history", default=DEFAULT_HISTORY_PATH, help="page duration history used to balance shards")
+    args = ap.parse_args(argv)
+
+    jobs = discover(args.paths, args.pattern, args.auth)
+    if not jobs:
+        print("no page configs found", file=sys.stderr)
+        return 2
+
+    def on_page(record):
+        status = "ok" if record.get("ok") else "FAIL"
+        print(f"[{status}] {record.get('name') or record['page']} ({record.get('elapsed_sec', 0)}s)", flush=True)
+
+    summary = run_suite(jobs, workers=args.workers, mode=args.mode, report_dir=args.report_dir, history_path=args.history, on_page=on_page, spa=args.spa)
+    print(f"{summary['pages']} page(s), {summary['failed_pages']} failed, {summary['elapsed_sec']}s", flush=True)
+    return 0 if summary["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
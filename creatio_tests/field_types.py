@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Optional
 
 
 class FieldType(Enum):
@@ -7,3 +8,19 @@ class FieldType(Enum):
     LOOKUP = "lookup"
     NUMBER = "number"
     DATETIME = "datetime"
+
+
+TAG_FIELD_TYPES = {
+    "crt-input": FieldType.TEXT,
+    "crt-checkbox": FieldType.BOOLEAN,
+    "crt-combobox": FieldType.LOOKUP,
+    "crt-number-input": FieldType.NUMBER,
+    "crt-date-input": FieldType.DATETIME,
+    "crt-time-input": FieldType.DATETIME,
+    "crt-date-time-input": FieldType.DATETIME,
+    "crt-datetimepicker": FieldType.DATETIME,
+}
+
+
+def infer_field_type(tag: str) -> Optional[FieldType]:
+    return TAG_FIELD_TYPES.get((tag or "").strip().lower())
@@ -1,3 +1,4 @@
+from contextlib import nullcontext
 from typing import Optional, Tuple, Callable
 import time
 from selenium.webdriver.common.by import By
@@ -6,12 +7,30 @@ from selenium.webdriver.remote.webelement import WebElement
 
 from ..models.result import ValidationResult
 from ..models.config import CheckContext
+from ..models.snapshot import FieldSnapshot
 from ..services.logger import Logger
+from ..services.dom_queries import REQUIRED_LABEL_SELECTOR
 from ..services.label_resolver import resolve_label
-from ..services.readonly_detector import ReadonlyDetector
+from ..services.readonly_detector import READONLY_DETECTOR
+from ..services.waits import wait_for_condition
+
+
+REQUIRED_INVALID_JS = """
+var host = arguments[0], inp = arguments[1];
+if (inp && (inp.getAttribute('aria-invalid') || '').trim().toLowerCase() === 'true') return 'invalid state detected';
+var errs = host.querySelectorAll(".mat-form-field-subscript-wrapper .mat-error, .mat-form-field-subscript-wrapper [role='alert']");
+for (var i = 0; i < errs.length; i++) {
+  if ((errs[i].innerText || errs[i].textContent || '').trim()) return 'error message detected';
+}
+return null;
+"""
 
 
 class BaseField:
+    CONTROL_SELECTOR: Optional[str] = None
+    CONTROL_NAME: str = ""
+    BULK_KIND: Optional[str] = None
+
     def __init__(
         self,
         code: str,
@@ -28,7 +47,12 @@ class BaseField:
         self.required = required
         self.ctx = context
         self.log = Logger(enabled=self.ctx.debug, prefix=(self.ctx.prefix if getattr(self.ctx, "prefix", "") else f"[field:{self.code}]"))
-        self._readonly = ReadonlyDetector()
+        self.readonly_detector = READONLY_DETECTOR
+
+    def _phase(self, name: str):
+        if self.ctx.tracer is None:
+            return nullcontext()
+        return self.ctx.tracer.scope(phase=name)
 
     def _safe_text(self, el: WebElement) -> str:
         try:
@@ -46,12 +70,29 @@ class BaseField:
         return ""
 
     def _probe_control(self, container: WebElement) -> Tuple[bool, str]:
-        return True, "control ok"
+        if not self.CONTROL_SELECTOR:
+            return True, "control ok"
+        try:
+            container.find_element(By.CSS_SELECTOR, self.CONTROL_SELECTOR)
+            return True, f"{self.CONTROL_NAME} control ok"
+        except Exception as e:
+            return False, f"{self.CONTROL_NAME} control not found: {e}"
+
+    def _probe_snapshot(self, snap: FieldSnapshot) -> Tuple[bool, str]:
+        if not self.CONTROL_SELECTOR:
+            return True, "control ok"
+        if snap.control:
+            return True, f"{self.CONTROL_NAME} control ok"
+        return False, f"{self.CONTROL_NAME} control not found: no element matches '{self.CONTROL_SELECTOR}'"
 
     def _check_title(self, container: WebElement) -> Tuple[bool, str, str]:
         if self.title is None:
             return True, "title check skipped", ""
-        txt = resolve_label(container, self.ctx.driver)
+        return self._match_title(resolve_label(container, self.ctx.driver))
+
+    def _match_title(self, txt: str) -> Tuple[bool, str, str]:
+        if self.title is None:
+            return True, "title check skipped", ""
         if not txt:
             return False, "label text is empty", ""
         if self.strict_title and txt != self.title:
@@ -60,16 +101,33 @@ class BaseField:
             return False, f"label does not contain expected substring: '{self.title}', got '{txt}'", txt
         return True, "title ok", txt
 
+    def check_title_text(self, label: Optional[str]) -> ValidationResult:
+        if label is None:
+            return ValidationResult(False, "field not found", {"code": self.code})
+        ok, msg, found = self._match_title(label)
+        return ValidationResult(ok, msg, {"code": self.code, "label_found": found})
+
     def _check_readonly(self, container: WebElement) -> Tuple[bool, str, str]:
         if self.readonly is None:
             return True, "readonly check skipped", ""
-        ro, reason = self._readonly.check(container)
+        ro, reason = self.readonly_detector.check(container)
+        return self._match_readonly(ro, reason)
+
+    def _match_readonly(self, ro: bool, reason: str) -> Tuple[bool, str, str]:
+        if self.readonly is None:
+            return True, "readonly check skipped", ""
         if self.readonly and not ro:
             return False, f"field is not readonly: {reason}", reason
         if not self.readonly and ro:
             return False, f"field is readonly: {reason}", reason
         return True, f"readonly ok: {reason}", reason
 
+    def check_readonly_verdict(self, verdict: Optional[Tuple[bool, str]]) -> ValidationResult:
+        if verdict is None:
+            return ValidationResult(False, "field not found", {"code": self.code})
+        ok, msg, reason = self._match_readonly(*verdict)
+        return ValidationResult(ok, msg, {"code": self.code, "readonly_reason": reason})
+
     def _find_editable(self, container: WebElement) -> Optional[WebElement]:
         for sel in ["input, textarea", "[role='combobox']"]:
             try:
@@ -178,7 +236,7 @@ class BaseField:
             except Exception:
                 pass
         try:
-            labels = container.find_elements(By.CSS_SELECTOR, ".crt-input-label, label, .crt-base-input-width-holder-label")
+            labels = container.find_elements(By.CSS_SELECTOR, REQUIRED_LABEL_SELECTOR)
             for le in labels:
                 cls = (le.get_attribute("class") or "")
                 if "crt-input-required" in cls:
@@ -189,6 +247,7 @@ class BaseField:
         return True, "required state read", is_req
 
     def trigger_required_validation(self, container: WebElement, timeout_sec: int = 10) -> Tuple[bool, str]:
+        deadline = time.time() + timeout_sec
         ok, msg = self.clear_value(container)
         if not ok:
             return False, msg
@@ -198,7 +257,13 @@ class BaseField:
                 self.ctx.driver.execute_script("arguments[0].dispatchEvent(new Event('blur',{bubbles:true}));", inp)
             except Exception:
                 pass
-        deadline = time.time() + timeout_sec
+        try:
+            found = wait_for_condition(self.ctx.driver, REQUIRED_INVALID_JS, max(0.0, deadline - time.time()), container, inp)
+            if found:
+                return True, str(found)
+            return False, "no required validation detected"
+        except Exception:
+            pass
         while time.time() < deadline:
             aria_invalid = ""
             try:
@@ -213,47 +278,118 @@ class BaseField:
                     return True, "error message detected"
             except Exception:
                 pass
-            time.sleep(0.15)
+            time.sleep(max(0.0, min(0.15, deadline - time.time())))
         return False, "no required validation detected"
 
-    def check(self, container: WebElement) -> ValidationResult:
-        ok, msg = self._probe_control(container)
+    def _evaluate(
+        self,
+        probe: Callable[[], Tuple[bool, str]],
+        title: Callable[[], Tuple[bool, str, str]],
+        readonly: Callable[[], Tuple[bool, str, str]],
+        required: Callable[[], bool],
+    ) -> ValidationResult:
+        with self._phase("probe"):
+            ok, msg = probe()
         if not ok:
             return ValidationResult(False, msg, {"code": self.code})
-        ok, tmsg, found = self._check_title(container)
+        with self._phase("title"):
+            ok, tmsg, found = title()
         if not ok:
             return ValidationResult(False, tmsg, {"code": self.code, "label_found": found})
-        ok, rmsg, reason = self._check_readonly(container)
+        with self._phase("readonly"):
+            ok, rmsg, reason = readonly()
         if not ok:
             return ValidationResult(False, rmsg, {"code": self.code, "readonly_reason": reason})
         if self.required is not None:
-            ok, _, is_req = self.check_required_state(container)
+            with self._phase("required"):
+                is_req = required()
             if self.required and not is_req:
                 return ValidationResult(False, "field is not marked as required", {"code": self.code})
             if not self.required and is_req:
                 return ValidationResult(False, "field is marked as required", {"code": self.code})
         return ValidationResult(True, "field is valid", {"code": self.code})
 
+    def check(self, container: WebElement, timeout_sec: Optional[float] = None) -> ValidationResult:
+        return self._evaluate(
+            probe=lambda: self._probe_control(container),
+            title=lambda: self._check_title(container),
+            readonly=lambda: self._check_readonly(container),
+            required=lambda: self.check_required_state(container)[2],
+        )
+
+    def check_snapshot(
+        self,
+        snap: FieldSnapshot,
+        resolve_element: Optional[Callable[[], Optional[WebElement]]] = None,
+        expensive: bool = True,
+        timeout_sec: Optional[float] = None,
+    ) -> ValidationResult:
+        if not snap.found:
+            return ValidationResult(False, "field not found", {"code": self.code})
+        return self._evaluate(
+            probe=lambda: self._probe_snapshot(snap),
+            title=lambda: self._match_title(snap.label),
+            readonly=lambda: self._match_readonly(*self.readonly_detector.evaluate(snap.readonly_state)),
+            required=lambda: snap.required,
+        )
+
+    def has_expensive_checks(self) -> bool:
+        return False
+
+    def check_cheap(self, container: WebElement) -> ValidationResult:
+        with self._phase("probe"):
+            ok, msg = self._probe_control(container)
+        if not ok:
+            return ValidationResult(False, msg, {"code": self.code})
+        if self.title is not None:
+            with self._phase("title"):
+                txt = resolve_label(container, self.ctx.driver)
+            if not txt:
+                return ValidationResult(False, "label text is empty", {"code": self.code, "label_found": ""})
+        return ValidationResult(True, "field is present", {"code": self.code})
+
+    def _resolve(self, resolve_element: Callable[[], Optional[WebElement]]) -> Optional[WebElement]:
+        try:
+            return resolve_element()
+        except Exception:
+            return None
+
     def await_for_check(
         self,
         resolve_element: Callable[[], Optional[WebElement]],
         timeout_sec: int = 30,
         poll_interval_sec: float = 0.25,
+        stable_polls: int = 2,
+        max_attempts: int = 3,
     ) -> ValidationResult:
         deadline = time.time() + timeout_sec
+        staged = self.has_expensive_checks()
         last_fail: Optional[ValidationResult] = None
+        stable = 0
+        attempt = 0
         while time.time() < deadline:
-            el = None
-            try:
-                el = resolve_element()
-            except Exception:
-                el = None
-            if el is not None:
-                res = self.check(el)
+            el = self._resolve(resolve_element)
+            if el is None:
+                stable = 0
+                last_fail = ValidationResult(False, "field not found for check", {"code": self.code})
+            elif staged and stable < stable_polls:
+                res = self.check_cheap(el)
                 if res.ok:
-                    return res
-                last_fail = res
+                    stable += 1
+                else:
+                    stable = 0
+                    last_fail = res
+                if stable >= stable_polls:
+                    continue
+            else:
+                attempt += 1
+                last_fail = self.check(el, timeout_sec=max(0.0, deadline - time.time()))
+                if last_fail.ok:
+                    return last_fail.with_detail("attempts", attempt)
+                stable = 0
+                if staged and attempt >= max_attempts:
+                    break
             time.sleep(poll_interval_sec)
-        if last_fail is not None:
-            return last_fail
-        return ValidationResult(False, "field not found for check", {"code": self.code})
+        if last_fail is None:
+            last_fail = ValidationResult(False, "field not found for check", {"code": self.code})
+        return last_fail.with_detail("attempts", attempt) if attempt else last_fail
@@ -5,16 +5,13 @@ from .base import BaseField
 
 
 class BooleanField(BaseField):
-    def _probe_control(self, container: WebElement):
-        try:
-            container.find_element(By.CSS_SELECTOR, "mat-checkbox input[type='checkbox']")
-            return True, "checkbox control ok"
-        except Exception as e:
-            return False, f"checkbox control not found: {e}"
+    CONTROL_SELECTOR = "mat-checkbox input[type='checkbox']"
+    CONTROL_NAME = "checkbox"
+    BULK_KIND = "checkbox"
 
     def set_value(self, container: WebElement, value) -> tuple[bool, str]:
         try:
-            inp = container.find_element(By.CSS_SELECTOR, "mat-checkbox input[type='checkbox']")
+            inp = container.find_element(By.CSS_SELECTOR, self.CONTROL_SELECTOR)
         except Exception as e:
             return False, f"checkbox not found: {e}"
         target = bool(value)
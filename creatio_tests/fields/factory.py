@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from ..models.config import CheckContext
 from ..field_types import FieldType
@@ -21,6 +21,7 @@ class FieldFactory:
         context: CheckContext,
         lookup_values: Optional[List[str]] = None,
         required: Optional[bool] = None,
+        lookup_source: Optional[Dict[str, str]] = None,
     ) -> BaseField:
         if field_type == FieldType.TEXT:
             return TextField(code, title, readonly, strict_title, context, required=required)
@@ -31,5 +32,5 @@ class FieldFactory:
         if field_type == FieldType.DATETIME:
             return DateTimeField(code, title, readonly, strict_title, context, required=required)
         if field_type == FieldType.LOOKUP:
-            return LookupField(code, title, readonly, strict_title, context, expected_options=lookup_values or [], required=required)
+            return LookupField(code, title, readonly, strict_title, context, expected_options=lookup_values or [], required=required, data_source=lookup_source)
         return TextField(code, title, readonly, strict_title, context, required=required)
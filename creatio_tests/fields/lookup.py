@@ -1,12 +1,18 @@
-from typing import List, Optional, Tuple
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
 
 from .base import BaseField
+from ..services.dom_queries import xpath_literal
 from ..services.overlay_service import OverlayService
 
 
 class LookupField(BaseField):
+    CONTROL_SELECTOR = ".crt-combobox-container, .crt-autocomplete-input-control, [role='combobox']"
+    CONTROL_NAME = "lookup"
+
     def __init__(
         self,
         code: str,
@@ -16,22 +22,42 @@ class LookupField(BaseField):
         context,
         expected_options: Optional[List[str]] = None,
         required: Optional[bool] = None,
+        data_source: Optional[Dict[str, str]] = None,
     ):
         super().__init__(code, title, readonly, strict_title, context, required=required)
         self.expected_options = expected_options or []
-        self.overlay = OverlayService(self.ctx.driver, self.ctx.wait_timeout_sec, logger=self.log)
-
+        self.data_source = data_source
+        self.overlay = OverlayService(self.ctx.driver, self.ctx.wait_timeout_sec, logger=self.log, reader=self.ctx.reader)
 
-    def _probe_control(self, container: WebElement):
+    def _read_data_source(self) -> Tuple[bool, List[str], str]:
+        src = self.data_source or {}
         try:
-            container.find_element(By.CSS_SELECTOR, ".crt-combobox-container, .crt-autocomplete-input-control, [role='combobox']")
-            return True, "lookup control ok"
+            options = self.ctx.data_client.fetch_column(src["entity"], src.get("column", "Name"), filter=src.get("filter"))
         except Exception as e:
-            return False, f"lookup control not found: {e}"
+            return False, [], f"lookup data source failed: {e}"
+        return True, options, "options fetched"
+
+    def _check_options_via_data_source(self, container: WebElement) -> Tuple[bool, str, List[str]]:
+        ok, msg = self.overlay.open(container)
+        if not ok:
+            return False, msg, []
+        try:
+            self.overlay.close()
+        except Exception:
+            pass
+        ok2, options, msg2 = self._read_data_source()
+        if not ok2:
+            return False, msg2, []
+        missing = [v for v in self.expected_options if v not in options]
+        if missing:
+            return False, f"lookup dictionary missing values: {missing}; actual: {options}", options
+        return True, "lookup dictionary ok", options
 
     def _check_options(self, container: WebElement) -> Tuple[bool, str, List[str]]:
         if not self.expected_options:
             return True, "lookup dictionary check skipped", []
+        if self.data_source and self.ctx.data_client is not None:
+            return self._check_options_via_data_source(container)
         ok, msg = self.overlay.open(container)
         if not ok:
             return False, msg, []
@@ -47,17 +73,43 @@ class LookupField(BaseField):
             pass
         return True, "lookup dictionary ok", options
 
+    def _type_ahead_select(self, container: WebElement, value: str) -> Tuple[bool, str]:
+        inp = self._find_editable(container)
+        if inp is None:
+            return False, "editable control not found"
+        try:
+            inp.click()
+        except Exception:
+            try:
+                self.ctx.driver.execute_script("arguments[0].click();", inp)
+            except Exception as e:
+                return False, f"cannot focus control: {e}"
+        try:
+            inp.send_keys(Keys.CONTROL, "a")
+            inp.send_keys(Keys.DELETE, value)
+        except Exception as e:
+            return False, f"cannot type search text: {e}"
+        try:
+            return self.overlay.select_typed(value)
+        except Exception as e:
+            return False, f"type-ahead selection failed: {e}"
+
     def set_value(self, container: WebElement, value: str) -> Tuple[bool, str]:
         if value is None or value == "":
             return False, "value is empty"
+        ok, msg = self._type_ahead_select(container, str(value))
+        if ok:
+            return True, msg
+        self.log.info(f"type-ahead selection failed, searching the overlay: {msg}")
         ok, msg = self.overlay.open(container)
         if not ok:
             return False, msg
+        lit = xpath_literal(str(value))
         try:
-            option = self.ctx.driver.find_element(By.XPATH, f"//div[contains(@class,'mat-autocomplete-panel') and contains(@class,'mat-autocomplete-visible')]//mat-option[.//text()[normalize-space()='{value}'] or .//*[normalize-space(text())='{value}']]")
+            option = self.ctx.driver.find_element(By.XPATH, f"//div[contains(@class,'mat-autocomplete-panel') and contains(@class,'mat-autocomplete-visible')]//mat-option[.//text()[normalize-space()={lit}] or .//*[normalize-space(text())={lit}]]")
         except Exception:
             try:
-                option = self.ctx.driver.find_element(By.XPATH, f"//div[contains(@class,'mat-autocomplete-panel') and contains(@class,'mat-autocomplete-visible')]//mat-option//*[contains(@class,'chip-text') or contains(@class,'mat-option-text')][normalize-space(text())='{value}']/ancestor::mat-option")
+                option = self.ctx.driver.find_element(By.XPATH, f"//div[contains(@class,'mat-autocomplete-panel') and contains(@class,'mat-autocomplete-visible')]//mat-option//*[contains(@class,'chip-text') or contains(@class,'mat-option-text')][normalize-space(text())={lit}]/ancestor::mat-option")
             except Exception as e:
                 return False, f"option not found: {e}"
         try:
@@ -99,11 +151,38 @@ class LookupField(BaseField):
             except Exception as e:
                 return False, f"cannot clear value: {e}"
 
-    def check(self, container: WebElement):
-        res = super().check(container)
+    @contextmanager
+    def _overlay_budget(self, timeout_sec: Optional[float]):
+        saved = self.overlay.timeout_sec
+        if timeout_sec is not None:
+            self.overlay.timeout_sec = max(1.0, min(float(saved), timeout_sec))
+        try:
+            yield
+        finally:
+            self.overlay.timeout_sec = saved
+
+    def _finish(self, res, container: Optional[WebElement], timeout_sec: Optional[float] = None):
         if not res.ok:
             return res
-        ok, msg, options = self._check_options(container)
+        if self.expected_options and container is None:
+            return type(res)(False, "field not found", {"code": self.code})
+        with self._phase("options"), self._overlay_budget(timeout_sec):
+            ok, msg, options = self._check_options(container)
         if not ok:
             return type(res)(False, msg, {"code": self.code, "options": options})
         return type(res)(True, "field is valid", {"code": self.code, "options": options if options else None})
+
+    def check(self, container: WebElement, timeout_sec: Optional[float] = None):
+        return self._finish(super().check(container), container, timeout_sec)
+
+    def has_expensive_checks(self) -> bool:
+        return bool(self.expected_options)
+
+    def check_snapshot(self, snap, resolve_element=None, expensive: bool = True, timeout_sec: Optional[float] = None):
+        res = super().check_snapshot(snap)
+        if not expensive:
+            return res
+        container = None
+        if res.ok and self.expected_options and resolve_element is not None:
+            container = resolve_element()
+        return self._finish(res, container, timeout_sec)
@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
 from selenium.webdriver.remote.webdriver import WebDriver
 
 
@@ -9,3 +9,37 @@ class CheckContext:
     wait_timeout_sec: int = 20
     debug: bool = False
     prefix: str = ""
+    data_client: Optional[Any] = None
+    tracer: Optional[Any] = None
+    reader: Optional[Any] = None
+
+
+DEFAULT_BLOCKED_URLS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+    "*fonts.googleapis.com*",
+    "*fonts.gstatic.com*",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.mp4",
+]
+
+
+@dataclass
+class LoadProfile:
+    block_urls: List[str] = field(default_factory=list)
+    user_data_dir: Optional[str] = None
+    disk_cache_dir: Optional[str] = None
+    disk_cache_size_mb: Optional[int] = None
+
+    def key(self) -> tuple:
+        return (tuple(self.block_urls), self.user_data_dir, self.disk_cache_dir, self.disk_cache_size_mb)
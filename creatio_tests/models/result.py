@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     ok: bool
     message: str
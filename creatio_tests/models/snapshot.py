@@ -0,0 +1,16 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class FieldSnapshot:
+    code: str
+    found: bool
+    tag: str = ""
+    control: bool = False
+    label: str = ""
+    readonly_state: Dict[str, Any] = field(default_factory=dict)
+    required: bool = False
+    value: Optional[str] = None
+    checked: Optional[bool] = None
+    html: Optional[str] = None
@@ -1,4 +1,6 @@
 from .auth_page import CreatioAuthPage
+from .driver_pool import DriverPool, get_driver_pool
 from .field_index import FieldIndex
+from .session_pool import SessionPool
 
-__all__ = ["CreatioAuthPage", "FieldIndex"]
+__all__ = ["CreatioAuthPage", "DriverPool", "get_driver_pool", "FieldIndex", "SessionPool"]
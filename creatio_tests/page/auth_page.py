@@ -1,39 +1,243 @@
 import json
 import sys
 import time
-from typing import Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 import requests
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 
-from .field_index import FieldIndex
+from .driver_pool import DriverPool, PooledDriver, launch_chrome, release_profile_dir
+from .field_index import FieldIndex, REGISTER_JS, REGISTRY_JS, RESOLVE_JS
+from ..field_types import infer_field_type
+from ..models.config import LoadProfile
+from ..models.snapshot import FieldSnapshot
+from ..services.cdp_reader import CdpReader
+from ..services.data_client import CreatioDataClient
+from ..services.page_snapshot import collect_snapshot
+from ..services.session_cache import SessionCache
+from ..services.tracer import CommandTracer
+from ..services.waits import ensure_script_timeout, wait_for_css, wait_for_element, wait_for_js_ready
 
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
 
 
+DEFAULT_SESSION_CHECK_PATH = "/0/ServiceModel/UserInfoService.svc/getCurrentUserInfo"
+
+BUILD_JS = """
+var t = window.Terrasoft;
+if (t && (t.coreVersion || t.productVersion)) return String(t.coreVersion || t.productVersion);
+var m = document.querySelector('meta[name="creatio-version"], meta[name="version"]');
+return m ? m.getAttribute('content') : null;
+"""
+
+
+LOAD_STATS_JS = """
+var entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+var out = {resources: entries.length, transfer_bytes: 0, encoded_bytes: 0, decoded_bytes: 0, cached: 0};
+entries.forEach(function(e){
+  out.transfer_bytes += e.transferSize || 0;
+  out.encoded_bytes += e.encodedBodySize || 0;
+  out.decoded_bytes += e.decodedBodySize || 0;
+  if (!e.transferSize && e.decodedBodySize) out.cached++;
+});
+return out;
+"""
+
+NAVIGATE_JS = """
+var target = new URL(arguments[0], location.href), token = arguments[1], from = location.href;
+document.querySelectorAll('[element-name]').forEach(function(h){ h.__crtNavToken = token; });
+if (target.origin !== location.origin) return {mode: 'reload', from: from};
+if (target.pathname === location.pathname && target.search === location.search) {
+  if (target.hash === location.hash) return {mode: 'same', from: from};
+  location.hash = target.hash;
+  return {mode: 'hash', from: from};
+}
+history.pushState(null, '', target.href);
+window.dispatchEvent(new PopStateEvent('popstate', {state: null}));
+return {mode: 'push', from: from};
+"""
+
+NEW_HOSTS_JS = """
+var done = arguments[arguments.length - 1];
+var token = arguments[0], target = new URL(arguments[1], location.href).href, from = arguments[2];
+var quietMs = arguments[3], timeoutMs = arguments[4];
+var finished = false, quiet = null, hard = null, obs = null;
+function routed(){ return location.href === target || location.href !== from; }
+function fresh(){
+  var hosts = document.querySelectorAll('[element-name]');
+  for (var i = 0; i < hosts.length; i++) {
+    if (hosts[i].__crtNavToken !== token) return true;
+  }
+  return false;
+}
+function finish(ok){
+  if (finished) return;
+  finished = true;
+  if (obs) obs.disconnect();
+  window.removeEventListener('popstate', arm);
+  window.removeEventListener('hashchange', arm);
+  clearTimeout(quiet);
+  clearTimeout(hard);
+  done(ok);
+}
+function arm(){
+  clearTimeout(quiet);
+  quiet = setTimeout(function(){
+    if (routed() && fresh()) finish(true); else arm();
+  }, quietMs);
+}
+function touchesHost(nodes){
+  for (var i = 0; i < nodes.length; i++) {
+    var n = nodes[i];
+    if (n.nodeType !== 1) continue;
+    if (n.hasAttribute('element-name') || n.querySelector('[element-name]')) return true;
+  }
+  return false;
+}
+obs = new MutationObserver(function(records){
+  for (var i = 0; i < records.length; i++) {
+    if (touchesHost(records[i].addedNodes) || touchesHost(records[i].removedNodes)) { arm(); return; }
+  }
+});
+obs.observe(document.documentElement, {childList: true, subtree: true});
+window.addEventListener('popstate', arm);
+window.addEventListener('hashchange', arm);
+hard = setTimeout(function(){ finish(false); }, timeoutMs);
+arm();
+"""
+
+INDEX_JS = REGISTRY_JS + """
+var done = arguments[arguments.length - 1];
+var quietMs = arguments[0], timeoutMs = arguments[1];
+var finished = false, quiet = null, hard = null, obs = null;
+function collect(){
+  var out = [], seen = {};
+  document.querySelectorAll('[element-name]').forEach(function(el){
+    var tag = el.tagName.toLowerCase();
+    if (tag.indexOf('crt-') !== 0) return;
+    var code = (el.getAttribute('element-name') || '').trim();
+    if (!code || seen[code]) return;
+    seen[code] = true;
+    out.push([code, tag, el]);
+  });
+  return out;
+}
+function finish(settled){
+  if (finished) return;
+  finished = true;
+  if (obs) obs.disconnect();
+  clearTimeout(quiet);
+  clearTimeout(hard);
+  var items = collect(), reg = crtRegistry();
+  items.forEach(function(it){ reg.hosts.set(it[0], it[2]); });
+  done({settled: settled, items: items, gen: reg.gen});
+}
+function arm(){
+  clearTimeout(quiet);
+  quiet = setTimeout(function(){
+    if (document.querySelector('[element-name]')) finish(true);
+  }, quietMs);
+}
+function touchesHost(nodes){
+  for (var i = 0; i < nodes.length; i++) {
+    var n = nodes[i];
+    if (n.nodeType !== 1) continue;
+    if (n.hasAttribute('element-name') || n.querySelector('[element-name]')) return true;
+  }
+  return false;
+}
+obs = new MutationObserver(function(records){
+  for (var i = 0; i < records.length; i++) {
+    var r = records[i];
+    if (r.type === 'attributes' || touchesHost(r.addedNodes) || touchesHost(r.removedNodes)) { arm(); return; }
+  }
+});
+obs.observe(document.documentElement, {childList: true, subtree: true, attributes: true, attributeFilter: ['element-name']});
+hard = setTimeout(function(){ finish(false); }, timeoutMs);
+arm();
+"""
+
 
 class CreatioAuthPage:
-    def __init__(self, base_url: str, username: str, password: str, test_url: str, headless: bool = True, wait_timeout_sec: int = 30, debug: bool = False):
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        test_url: str,
+        headless: bool = True,
+        wait_timeout_sec: int = 30,
+        debug: bool = False,
+        session_cache: Optional[SessionCache] = None,
+        session_check_path: str = DEFAULT_SESSION_CHECK_PATH,
+        driver_pool: Optional[DriverPool] = None,
+        odata_path: str = "/0/odata",
+        reader_backend: str = "webdriver",
+        load_profile: Optional[LoadProfile] = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.username = username
         self.password = password
         self.test_url = test_url
+        self.headless = headless
         self.wait_timeout_sec = wait_timeout_sec
         self.debug = debug
+        self.session_cache = session_cache
+        self.session_check_path = session_check_path
         self._http = requests.Session()
-        chrome_opts = Options()
-        if headless:
-            chrome_opts.add_argument("--headless=new")
-        chrome_opts.add_argument("--disable-gpu")
-        chrome_opts.add_argument("--window-size=1920,1080")
-        chrome_opts.add_argument("--no-sandbox")
-        chrome_opts.add_argument("--disable-dev-shm-usage")
-        self.driver = webdriver.Chrome(options=chrome_opts)
+        self.odata_path = odata_path
+        self.data = CreatioDataClient(self._http, self.base_url, odata_path=odata_path)
+        self.driver_pool = driver_pool
+        self.load_profile = load_profile
+        self.last_load_stats: Optional[Dict] = None
+        self._lease: Optional[PooledDriver] = None
+        self._profile_dir: Optional[str] = None
+        if driver_pool is not None:
+            self._lease = driver_pool.acquire(headless, load_profile)
+            self.driver = self._lease.driver
+        else:
+            self.driver, self._profile_dir = launch_chrome(headless, load_profile, self._log)
         self.page_html: Optional[str] = None
+        self.current_url: Optional[str] = None
         self.fields = FieldIndex()
+        self.tracer: Optional[CommandTracer] = None
+        self.reader_backend = reader_backend
+        self._cdp: Optional[CdpReader] = None
+
+    @property
+    def reader(self):
+        if self.reader_backend == "cdp" and hasattr(self.driver, "execute_cdp_cmd"):
+            if self._cdp is None or self._cdp.driver is not self.driver:
+                self._cdp = CdpReader(self.driver)
+            return self._cdp
+        return self.driver
+
+    def enable_tracing(self, tracer: Optional[CommandTracer] = None) -> CommandTracer:
+        self.tracer = tracer or self.tracer or CommandTracer()
+        self.tracer.install(self.driver)
+        return self.tracer
+
+    def clone(self) -> "CreatioAuthPage":
+        page = CreatioAuthPage(
+            base_url=self.base_url,
+            username=self.username,
+            password=self.password,
+            test_url=self.test_url,
+            headless=self.headless,
+            wait_timeout_sec=self.wait_timeout_sec,
+            debug=self.debug,
+            session_cache=self.session_cache,
+            session_check_path=self.session_check_path,
+            driver_pool=self.driver_pool,
+            odata_path=self.odata_path,
+            reader_backend=self.reader_backend,
+            load_profile=self.load_profile,
+        )
+        if self.tracer is not None:
+            page.enable_tracing(self.tracer)
+        return page
 
     def _log(self, msg: str):
         if self.debug:
@@ -59,9 +263,65 @@ class CreatioAuthPage:
         self._log("Cookies: " + ", ".join([c.name for c in self._http.cookies]))
         return self._http.cookies
 
+    def _csrf_headers(self) -> Dict[str, str]:
+        token = self._http.cookies.get("BPMCSRF")
+        return {"BPMCSRF": token} if token else {}
+
+    def _validate_session(self) -> bool:
+        url = f"{self.base_url}{self.session_check_path}"
+        try:
+            resp = self._http.post(url, json={}, headers=self._csrf_headers(), timeout=15, allow_redirects=False)
+        except Exception as e:
+            self._log(f"session check failed: {e}")
+            return False
+        self._log(f"Session check HTTP {resp.status_code}")
+        return resp.status_code == 200
+
+    def _get_session_cookies(self) -> requests.cookies.RequestsCookieJar:
+        if self.session_cache is None:
+            return self._login_and_get_cookies()
+        with self.session_cache.lock(self.base_url, self.username):
+            cached = self.session_cache.load(self.base_url, self.username)
+            if cached:
+                for c in cached:
+                    self._http.cookies.set(c["name"], c["value"], domain=c.get("domain", ""), path=c.get("path") or "/", secure=bool(c.get("secure")), expires=c.get("expires"))
+                if self._validate_session():
+                    self._log("cached session accepted")
+                    return self._http.cookies
+                self._log("cached session rejected")
+                self._http.cookies.clear()
+                self.session_cache.invalidate(self.base_url, self.username)
+            cookies = self._login_and_get_cookies()
+            self.session_cache.save(self.base_url, self.username, cookies)
+            return cookies
+
+    def _identity(self, cookies) -> Tuple:
+        return (self.base_url, self.username, tuple(sorted((c.name, c.value) for c in cookies)))
+
     def login(self):
-        cookies = self._login_and_get_cookies()
-        self.driver.get(self.base_url)
+        cookies = self._get_session_cookies()
+        identity = self._identity(cookies)
+        if self._lease is not None and self._lease.logged_in_as == identity:
+            self._log("pooled browser already logged in")
+            return
+        self._inject_cookies(self.driver, cookies)
+        if self._lease is not None:
+            self._lease.logged_in_as = identity
+
+    def prewarm_pool(self, count: int):
+        if self.driver_pool is None or count <= 0:
+            return
+        cookies = self._get_session_cookies()
+        identity = self._identity(cookies)
+
+        def setup(lease: PooledDriver):
+            self._inject_cookies(lease.driver, cookies)
+            lease.logged_in_as = identity
+
+        self.driver_pool.prewarm(self.headless, count, self.load_profile, setup=setup)
+
+    def _inject_cookies(self, driver, cookies):
+        driver.get(self.base_url)
         time.sleep(0.5)
         for c in cookies:
             cookie_dict = {"name": c.name, "value": c.value, "path": c.path or "/"}
@@ -70,56 +330,95 @@ class CreatioAuthPage:
             if getattr(c, "secure", None) is not None:
                 cookie_dict["secure"] = bool(c.secure)
             try:
-                self.driver.add_cookie(cookie_dict)
+                driver.add_cookie(cookie_dict)
                 self._log(f"Cookie set: {c.name}")
             except Exception as e:
                 self._log(f"Cookie add failed: {c.name}: {e}")
 
+    def _resolve_url(self, url: str) -> str:
+        if url.startswith("http://") or url.startswith("https://"):
+            return url
+        return f"{self.base_url}{url if url.startswith('/') else '/' + url}"
+
     def _resolve_test_url(self) -> str:
-        if self.test_url.startswith("http://") or self.test_url.startswith("https://"):
-            return self.test_url
-        return f"{self.base_url}{self.test_url if self.test_url.startswith('/') else '/' + self.test_url}"
+        return self._resolve_url(self.test_url)
 
-    def load_page(self):
-        url = self._resolve_test_url()
+    def load_page(self, url: Optional[str] = None):
+        url = self._resolve_url(url) if url else self._resolve_test_url()
+        self.current_url = url
         self._log(f"GET {url}")
+        started = time.time()
         self.driver.get(url)
-        deadline = time.time() + self.wait_timeout_sec
-        while time.time() < deadline:
-            try:
-                state = self.driver.execute_script("return document.readyState") or ""
-                if state == "complete":
-                    break
-            except Exception:
-                pass
-            time.sleep(0.05)
-        self._log("document.readyState == complete")
-        root_deadline = time.time() + self.wait_timeout_sec
-        root_detected = False
-        while time.time() < root_deadline:
-            try:
-                if self.driver.find_elements(By.CSS_SELECTOR, "[class*='crt-'], [data-component*='crt']"):
-                    root_detected = True
-                    break
-            except Exception:
-                pass
-            time.sleep(0.05)
-        if root_detected:
+        if wait_for_js_ready(self.driver, self.wait_timeout_sec):
+            self._log("document.readyState == complete")
+        if wait_for_css(self.driver, "[class*='crt-'], [data-component*='crt']", self.wait_timeout_sec):
             self._log("CRT root detected")
         else:
             self._log("CRT root not detected")
-        try:
-            el_deadline = time.time() + self.wait_timeout_sec
-            while time.time() < el_deadline:
-                if self.driver.find_elements(By.CSS_SELECTOR, "[element-name]"):
-                    self._log("at least one [element-name] detected")
-                    break
-                time.sleep(0.05)
-        except Exception:
+        fields_seen = wait_for_css(self.driver, "[element-name]", self.wait_timeout_sec)
+        if fields_seen:
+            self._log("at least one [element-name] detected")
+        else:
             self._log("no [element-name] detected within timeout")
+        stats: Dict = {"time_to_fields_sec": round(time.time() - started, 3) if fields_seen else None}
+        try:
+            stats.update(self.reader.execute_script(LOAD_STATS_JS) or {})
+        except Exception as e:
+            self._log(f"load stats unavailable: {e}")
+        self.last_load_stats = stats
+        self._log(f"load stats: {stats}")
         self.page_html = self.driver.page_source
 
-    def build_fields_index(self):
+    def _reindex(self, quiet_ms: int):
+        self.fields.clear()
+        self.build_fields_index(one_shot=True, quiet_ms=quiet_ms)
+        self.page_html = self.driver.page_source
+
+    def navigate(self, url: str, quiet_ms: int = 300, timeout_sec: Optional[int] = None) -> bool:
+        target = self._resolve_url(url)
+        timeout = timeout_sec or self.wait_timeout_sec
+        token = f"nav-{time.time()}"
+        try:
+            res = self.driver.execute_script(NAVIGATE_JS, target, token) or {}
+        except Exception as e:
+            self._log(f"client-side navigation failed: {e}")
+            res = {}
+        mode = res.get("mode") or "reload"
+        self._log(f"navigate {target}: {mode}")
+        if mode == "same":
+            self.current_url = target
+            self._reindex(quiet_ms)
+            return True
+        if mode in ("hash", "push"):
+            try:
+                ensure_script_timeout(self.driver, timeout + 5)
+                if self.driver.execute_async_script(NEW_HOSTS_JS, token, target, res.get("from") or "", quiet_ms, timeout * 1000):
+                    self.current_url = target
+                    self._reindex(quiet_ms)
+                    return True
+                self._log("route did not settle with new [element-name] hosts, reloading")
+            except Exception as e:
+                self._log(f"waiting for new field hosts failed, reloading: {e}")
+        self.load_page(target)
+        self._reindex(quiet_ms)
+        return False
+
+    def _build_fields_index_one_shot(self, quiet_ms: int):
+        ensure_script_timeout(self.driver, self.wait_timeout_sec + 5)
+        res = self.driver.execute_async_script(INDEX_JS, quiet_ms, self.wait_timeout_sec * 1000) or {}
+        self.fields.clear()
+        for code, tag, el in res.get("items", []):
+            self.fields.add(code, el, tag=tag, field_type=infer_field_type(tag))
+        self._log(f"indexing: total={len(self.fields)}, settled={bool(res.get('settled'))}, gen={res.get('gen')}")
+
+    def build_fields_index(self, one_shot: bool = False, quiet_ms: int = 300):
+        if one_shot:
+            try:
+                self._build_fields_index_one_shot(quiet_ms)
+                self._log(f"Indexed fields: {len(self.fields)}")
+                return
+            except Exception as e:
+                self._log(f"one-shot indexing failed, falling back to polling: {e}")
         deadline = time.time() + self.wait_timeout_sec
         last_count = -1
         stable_ticks = 0
@@ -161,13 +460,41 @@ class CreatioAuthPage:
             if cur_count > 0 and stable_ticks >= 4:
                 break
             time.sleep(poll_interval)
+        try:
+            self.driver.execute_script(REGISTER_JS, [[code, el] for code, el in self.fields.items()])
+        except Exception as e:
+            self._log(f"field registry not installed: {e}")
         self._log(f"Indexed fields: {len(self.fields)}")
 
+    def detect_build(self) -> str:
+        try:
+            build = self.reader.execute_script(BUILD_JS)
+        except Exception as e:
+            self._log(f"cannot detect Creatio build: {e}")
+            build = None
+        return str(build or "unknown")
+
+    def save_page_html(self, path: str) -> str:
+        if not self.page_html:
+            raise RuntimeError("page_html is empty: call load_page() first")
+        Path(path).write_text(self.page_html, encoding="utf-8")
+        return str(path)
+
     def close(self):
+        if self.driver is None:
+            return
+        if self._lease is not None and self.driver_pool is not None:
+            lease, self._lease = self._lease, None
+            self.driver = None
+            self.driver_pool.release(lease)
+            return
+        driver, self.driver = self.driver, None
         try:
-            self.driver.quit()
+            driver.quit()
         except Exception:
             pass
+        release_profile_dir(self._profile_dir)
+        self._profile_dir = None
 
     def get_field_fresh(self, code: str):
         try:
@@ -175,11 +502,41 @@ class CreatioAuthPage:
         except NoSuchElementException:
             return None
 
+    def resolve_fields(self, codes: List[str], refresh: bool = False) -> Dict[str, Optional[object]]:
+        cached = [c for c in codes if self.fields.get(c) is not None] if refresh else []
+        missing = [c for c in codes if self.fields.get(c) is None]
+        if not cached and not missing:
+            return {c: self.fields.get(c) for c in codes}
+        try:
+            res = self.driver.execute_script(RESOLVE_JS, cached, missing) or {}
+        except Exception as e:
+            self._log(f"batched resolve failed, resolving one by one: {e}")
+            return {c: self.get_field_fresh(c) for c in codes}
+        resolved = res.get("resolved") or {}
+        for code, el in resolved.items():
+            self.fields.set(code, el)
+        if resolved:
+            self._log(f"re-resolved {len(resolved)} field(s) at generation {res.get('gen')}")
+        return {c: self.fields.get(c) for c in codes}
+
+    def get_field(self, code: str):
+        return self.resolve_fields([code]).get(code)
+
+    def refresh_field(self, code: str):
+        return self.resolve_fields([code], refresh=True).get(code)
+
+    def collect_snapshot(self, specs: List[Tuple[str, Optional[str]]], with_html: bool = False) -> Optional[Dict[str, FieldSnapshot]]:
+        reader = self.reader
+        if reader is not self.driver:
+            try:
+                return collect_snapshot(reader, specs, with_html)
+            except Exception as e:
+                self._log(f"{self.reader_backend} snapshot failed, using WebDriver: {e}")
+        try:
+            return collect_snapshot(self.driver, specs, with_html)
+        except Exception as e:
+            self._log(f"snapshot failed: {e}")
+            return None
+
     def await_field_present(self, code: str, timeout_sec: int = 30, poll_interval_sec: float = 0.25):
-        deadline = time.time() + timeout_sec
-        while time.time() < deadline:
-            el = self.get_field_fresh(code)
-            if el is not None:
-                return el
-            time.sleep(poll_interval_sec)
-        return None
+        return wait_for_element(self.driver, f"[element-name='{code}']", timeout_sec, poll_interval_sec)
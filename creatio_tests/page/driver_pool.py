@@ -0,0 +1,271 @@
+import atexit
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Callable, Dict, List, Optional, Tuple
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from ..models.config import LoadProfile
+from ..services.tracer import CommandTracer
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+RESET_STORAGE_JS = "try { window.localStorage.clear(); } catch (e) {} try { window.sessionStorage.clear(); } catch (e) {}"
+RESOURCE_BUFFER_JS = "try { performance.setResourceTimingBufferSize(10000); } catch (e) {}"
+
+
+_CLAIMED_DIRS: Dict[str, IO] = {}
+_CLAIM_LOCK = threading.Lock()
+
+
+def _try_lock(fh) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        elif msvcrt is not None:
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def claim_profile_dir(base: str) -> str:
+    root = Path(base).expanduser().resolve()
+    root.mkdir(parents=True, exist_ok=True)
+    with _CLAIM_LOCK:
+        for i in range(256):
+            d = root / f"p{i}"
+            if str(d) in _CLAIMED_DIRS:
+                continue
+            fh = open(root / f"p{i}.lock", "a+")
+            if not _try_lock(fh):
+                fh.close()
+                continue
+            d.mkdir(exist_ok=True)
+            try:
+                (d / "SingletonLock").unlink()
+            except FileNotFoundError:
+                pass
+            _CLAIMED_DIRS[str(d)] = fh
+            return str(d)
+    raise RuntimeError(f"no free browser profile directory under {root}")
+
+
+def release_profile_dir(path: Optional[str]):
+    if not path:
+        return
+    with _CLAIM_LOCK:
+        fh = _CLAIMED_DIRS.pop(path, None)
+    if fh is not None:
+        fh.close()
+
+
+def build_chrome_options(headless: bool, profile: Optional[LoadProfile] = None, profile_dir: Optional[str] = None) -> Options:
+    chrome_opts = Options()
+    if headless:
+        chrome_opts.add_argument("--headless=new")
+    chrome_opts.add_argument("--disable-gpu")
+    chrome_opts.add_argument("--window-size=1920,1080")
+    chrome_opts.add_argument("--no-sandbox")
+    chrome_opts.add_argument("--disable-dev-shm-usage")
+    if profile_dir:
+        chrome_opts.add_argument(f"--user-data-dir={profile_dir}")
+    if profile is not None:
+        if profile.disk_cache_dir:
+            chrome_opts.add_argument(f"--disk-cache-dir={Path(profile.disk_cache_dir).expanduser().resolve()}")
+        if profile.disk_cache_size_mb:
+            chrome_opts.add_argument(f"--disk-cache-size={int(profile.disk_cache_size_mb) * 1024 * 1024}")
+    return chrome_opts
+
+
+def apply_load_profile(driver: WebDriver, profile: Optional[LoadProfile], log: Callable[[str], None] = lambda msg: None):
+    if profile is None:
+        return
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": RESOURCE_BUFFER_JS})
+    except Exception as e:
+        log(f"resource timing buffer not raised: {e}")
+    if not profile.block_urls:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(profile.block_urls)})
+        log(f"blocking {len(profile.block_urls)} URL pattern(s)")
+    except Exception as e:
+        log(f"URL blocking unavailable: {e}")
+
+
+def launch_chrome(headless: bool, profile: Optional[LoadProfile] = None, log: Callable[[str], None] = lambda msg: None) -> Tuple[WebDriver, Optional[str]]:
+    profile_dir = claim_profile_dir(profile.user_data_dir) if profile is not None and profile.user_data_dir else None
+    try:
+        driver = webdriver.Chrome(options=build_chrome_options(headless, profile, profile_dir))
+    except Exception:
+        release_profile_dir(profile_dir)
+        raise
+    apply_load_profile(driver, profile, log)
+    return driver, profile_dir
+
+
+@dataclass
+class PooledDriver:
+    driver: WebDriver
+    headless: bool
+    uses: int = 0
+    created_at: float = field(default_factory=time.time)
+    released_at: float = field(default_factory=time.time)
+    logged_in_as: Optional[Tuple] = None
+    profile_key: Optional[Tuple] = None
+    profile_dir: Optional[str] = None
+
+
+class DriverPool:
+    def __init__(self, size: int = 2, max_uses: int = 20, max_idle_sec: int = 600, debug: bool = False):
+        self.size = max(0, int(size))
+        self.max_uses = max(1, int(max_uses))
+        self.max_idle_sec = max(0, int(max_idle_sec))
+        self.debug = debug
+        self._idle: List[PooledDriver] = []
+        self._lock = threading.Lock()
+
+    def _log(self, msg: str):
+        if self.debug:
+            print(f"[driver-pool] {msg}", file=sys.stderr, flush=True)
+
+    def configure(self, size: Optional[int] = None, max_uses: Optional[int] = None, max_idle_sec: Optional[int] = None):
+        if size is not None:
+            self.size = max(0, int(size))
+        if max_uses is not None:
+            self.max_uses = max(1, int(max_uses))
+        if max_idle_sec is not None:
+            self.max_idle_sec = max(0, int(max_idle_sec))
+
+    def _launch(self, headless: bool, profile: Optional[LoadProfile] = None) -> PooledDriver:
+        self._log(f"launching chrome (headless={headless})")
+        driver, profile_dir = launch_chrome(headless, profile, self._log)
+        return PooledDriver(
+            driver=driver,
+            headless=headless,
+            profile_key=profile.key() if profile is not None else None,
+            profile_dir=profile_dir,
+        )
+
+    def _quit(self, lease: PooledDriver):
+        try:
+            lease.driver.quit()
+        except Exception:
+            pass
+        release_profile_dir(lease.profile_dir)
+
+    def _alive(self, lease: PooledDriver) -> bool:
+        try:
+            _ = lease.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def acquire(self, headless: bool, profile: Optional[LoadProfile] = None) -> PooledDriver:
+        key = profile.key() if profile is not None else None
+        now = time.time()
+        expired: List[PooledDriver] = []
+        lease = None
+        with self._lock:
+            keep: List[PooledDriver] = []
+            for item in self._idle:
+                if self.max_idle_sec and now - item.released_at > self.max_idle_sec:
+                    expired.append(item)
+                elif lease is None and item.headless == headless and item.profile_key == key:
+                    lease = item
+                else:
+                    keep.append(item)
+            self._idle = keep
+        for item in expired:
+            self._quit(item)
+        if lease is not None and not self._alive(lease):
+            self._quit(lease)
+            lease = None
+        if lease is None:
+            lease = self._launch(headless, profile)
+        lease.uses += 1
+        self._log(f"lease acquired (uses={lease.uses})")
+        return lease
+
+    def release(self, lease: PooledDriver):
+        CommandTracer.uninstall(lease.driver)
+        if lease.uses >= self.max_uses:
+            self._log("lease recycled (max uses reached)")
+            self._quit(lease)
+            return
+        try:
+            lease.driver.execute_script(RESET_STORAGE_JS)
+            lease.driver.get("about:blank")
+        except Exception as e:
+            self._log(f"reset failed, dropping driver: {e}")
+            self._quit(lease)
+            return
+        lease.released_at = time.time()
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(lease)
+                return
+        self._log("pool full, quitting driver")
+        self._quit(lease)
+
+    def prewarm(
+        self,
+        headless: bool,
+        count: Optional[int] = None,
+        profile: Optional[LoadProfile] = None,
+        setup: Optional[Callable[[PooledDriver], None]] = None,
+    ):
+        with self._lock:
+            missing = (self.size if count is None else min(int(count), self.size)) - len(self._idle)
+        for _ in range(max(0, missing)):
+            lease = self._launch(headless, profile)
+            if setup is not None:
+                try:
+                    setup(lease)
+                except Exception as e:
+                    self._log(f"prewarm setup failed, dropping driver: {e}")
+                    self._quit(lease)
+                    continue
+            with self._lock:
+                self._idle.append(lease)
+
+    def shutdown(self):
+        with self._lock:
+            items, self._idle = self._idle, []
+        for item in items:
+            self._quit(item)
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+
+_POOL: Optional[DriverPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_driver_pool(size: Optional[int] = None, max_uses: Optional[int] = None, max_idle_sec: Optional[int] = None, debug: bool = False) -> DriverPool:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = DriverPool(debug=debug)
+            atexit.register(_POOL.shutdown)
+        _POOL.configure(size=size, max_uses=max_uses, max_idle_sec=max_idle_sec)
+        _POOL.debug = _POOL.debug or debug
+        return _POOL
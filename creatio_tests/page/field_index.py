@@ -1,20 +1,92 @@
 from typing import Dict, Optional, Iterable
 from selenium.webdriver.remote.webelement import WebElement
 
+from ..field_types import FieldType
+
+
+REGISTRY_JS = """
+function crtRegistry(){
+  var reg = window.__crtFieldRegistry;
+  if (reg && reg.hosts) return reg;
+  reg = {gen: 1, hosts: new Map()};
+  reg.observer = new MutationObserver(function(records){
+    var removed = false;
+    for (var i = 0; i < records.length; i++) {
+      if (records[i].removedNodes.length) { removed = true; break; }
+    }
+    if (!removed) return;
+    var changed = false;
+    reg.hosts.forEach(function(el, code){
+      if (!el.isConnected) { reg.hosts.delete(code); changed = true; }
+    });
+    if (changed) reg.gen++;
+  });
+  reg.observer.observe(document.documentElement, {childList: true, subtree: true});
+  window.__crtFieldRegistry = reg;
+  return reg;
+}
+"""
+
+REGISTER_JS = REGISTRY_JS + """
+var reg = crtRegistry();
+arguments[0].forEach(function(pair){ reg.hosts.set(pair[0], pair[1]); });
+return reg.gen;
+"""
+
+RESOLVE_JS = REGISTRY_JS + """
+var cached = arguments[0], missing = arguments[1], reg = crtRegistry(), out = {};
+function lookup(code){
+  var el = document.querySelector('[element-name="' + CSS.escape(code) + '"]');
+  if (el) reg.hosts.set(code, el); else reg.hosts.delete(code);
+  out[code] = el || null;
+}
+cached.forEach(function(code){
+  var el = reg.hosts.get(code);
+  if (!el || !el.isConnected) lookup(code);
+});
+missing.forEach(lookup);
+return {gen: reg.gen, resolved: out};
+"""
+
 
 class FieldIndex:
     def __init__(self):
         self._items: Dict[str, WebElement] = {}
+        self._tags: Dict[str, str] = {}
+        self._types: Dict[str, Optional[FieldType]] = {}
 
-    def add(self, code: str, element: WebElement):
+    def add(self, code: str, element: WebElement, tag: Optional[str] = None, field_type: Optional[FieldType] = None):
         if not code:
             return
         if code not in self._items:
             self._items[code] = element
+            if tag:
+                self._tags[code] = tag
+            if field_type is not None:
+                self._types[code] = field_type
+
+    def set(self, code: str, element: Optional[WebElement]):
+        if not code:
+            return
+        if element is None:
+            self._items.pop(code, None)
+            return
+        self._items[code] = element
+
+    def clear(self):
+        self._items.clear()
+        self._tags.clear()
+        self._types.clear()
 
     def get(self, code: str) -> Optional[WebElement]:
         return self._items.get(code)
 
+    def tag(self, code: str) -> Optional[str]:
+        return self._tags.get(code)
+
+    def field_type(self, code: str) -> Optional[FieldType]:
+        return self._types.get(code)
+
     def keys(self) -> Iterable[str]:
         return self._items.keys()
 
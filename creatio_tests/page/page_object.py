@@ -1,23 +1,91 @@
-from typing import Dict, Tuple, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Callable, Dict, Iterable, List, Tuple, Optional
 from ..models.config import CheckContext
 from ..models.result import ValidationResult
 from ..field_types import FieldType
 from ..fields.factory import FieldFactory
+from ..services.data_client import read_column, values_match
+from ..services.form_filler import fill_fields
+from ..services.label_resolver import resolve_label, resolve_labels
+from ..services.readonly_detector import READONLY_DETECTOR
+from ..services.result_sink import ResultSink, result_record
+from ..services.snapshot_store import SnapshotStore, diff_records, snapshot_record
+from ..services.static_snapshot import collect_static_snapshot
 from .auth_page import CreatioAuthPage
+from .session_pool import SessionPool
+
+
+NOT_FOUND_MESSAGE = "field not found for check"
 
 
 class PageObject:
-    def __init__(self, name: str, client: CreatioAuthPage, default_wait_timeout_sec: int = 30, debug: bool = False):
+    def __init__(
+        self,
+        name: str,
+        client: CreatioAuthPage,
+        default_wait_timeout_sec: int = 30,
+        debug: bool = False,
+        sink: Optional[ResultSink] = None,
+    ):
         self.name = name
         self.client = client
         self.default_wait_timeout_sec = default_wait_timeout_sec
         self.debug = debug
+        self.sink = sink
         self.fields: Dict[str, object] = {}
+        self._specs: Dict[str, dict] = {}
 
     def _log(self, field_code: str, msg: str):
         if self.debug:
             print(f"[{self.name}][{field_code}] {msg}", flush=True)
 
+    def _emit(self, code: str, r: ValidationResult, started_at: float, attempts: int = 1, round_trips: Optional[int] = None):
+        if self.sink is None:
+            return
+        try:
+            self.sink.write(result_record(self.name, code, r, started_at, attempts=attempts, round_trips=round_trips))
+        except Exception as e:
+            self._log(code, f"result sink failed: {e}")
+
+    def _trace(self, code: str = "", phase: Optional[str] = None):
+        tracer = getattr(self.client, "tracer", None)
+        if tracer is None:
+            return nullcontext()
+        return tracer.scope(page=self.name, code=code, phase=phase)
+
+    def _resolve(self, code: str):
+        with self._trace(code, "resolve"):
+            return self.client.get_field(code)
+
+    def _resolve_many(self, codes: List[str]) -> Dict[str, object]:
+        with self._trace(phase="resolve"):
+            return self.client.resolve_fields(codes)
+
+    def _refresh(self, code: str):
+        refresh = getattr(self.client, "refresh_field", None)
+        if refresh is None:
+            return None
+        with self._trace(code, "resolve"):
+            return refresh(code)
+
+    def _checked(self, code: str, run: Callable[[Callable[[], object]], ValidationResult], elements: Optional[Dict[str, object]] = None) -> ValidationResult:
+        used: List[object] = []
+
+        def resolve():
+            used.append(elements[code] if elements and code in elements else self._resolve(code))
+            return used[-1]
+
+        r = run(resolve)
+        if r.ok or not used or used[-1] is None:
+            return r
+        fresh = self._refresh(code)
+        if fresh is None or getattr(fresh, "id", fresh) == getattr(used[-1], "id", used[-1]):
+            return r
+        self._log(code, "cached element went stale, re-checking with a fresh handle")
+        return run(lambda: fresh)
+
     def add_field(
         self,
         field_type: FieldType,
@@ -28,12 +96,29 @@ class PageObject:
         required: Optional[bool] = None,
         lookup_values: Optional[list] = None,
         wait_timeout_sec: Optional[int] = None,
+        lookup_source: Optional[dict] = None,
+        column: Optional[str] = None,
     ):
+        self._specs[code] = dict(
+            field_type=field_type,
+            code=code,
+            title=title,
+            readonly=readonly,
+            strict_title=strict_title,
+            required=required,
+            lookup_values=lookup_values,
+            wait_timeout_sec=wait_timeout_sec,
+            lookup_source=lookup_source,
+            column=column,
+        )
         ctx = CheckContext(
-            driver=self.client.driver,
+            driver=getattr(self.client, "driver", None),
             wait_timeout_sec=wait_timeout_sec or self.default_wait_timeout_sec,
             debug=self.debug,
-            prefix=f"[{self.name}][{code}]"
+            prefix=f"[{self.name}][{code}]",
+            data_client=getattr(self.client, "data", None),
+            tracer=getattr(self.client, "tracer", None),
+            reader=getattr(self.client, "reader", None),
         )
         f = FieldFactory.create(
             field_type=field_type,
@@ -44,35 +129,356 @@ class PageObject:
             context=ctx,
             lookup_values=lookup_values,
             required=required,
+            lookup_source=lookup_source,
         )
         self.fields[code] = f
         self._log(code, "field registered")
 
-    def check_all(self) -> Tuple[bool, Dict[str, ValidationResult]]:
+    def for_client(self, client: CreatioAuthPage, codes: Optional[Iterable[str]] = None) -> "PageObject":
+        wanted = set(codes) if codes is not None else None
+        page = PageObject(name=self.name, client=client, default_wait_timeout_sec=self.default_wait_timeout_sec, debug=self.debug, sink=self.sink)
+        for code, spec in self._specs.items():
+            if wanted is None or code in wanted:
+                page.add_field(**spec)
+        return page
+
+    def _field_weight(self, code: str) -> int:
+        spec = self._specs.get(code, {})
+        if spec.get("field_type") == FieldType.LOOKUP and spec.get("lookup_values"):
+            return 10
+        return 1
+
+    def _partition(self, n: int) -> List[List[str]]:
+        shards: List[List[str]] = [[] for _ in range(n)]
+        loads = [0] * n
+        for code in sorted(self.fields, key=self._field_weight, reverse=True):
+            i = loads.index(min(loads))
+            shards[i].append(code)
+            loads[i] += self._field_weight(code)
+        return shards
+
+    def set_value(self, code: str, value) -> ValidationResult:
+        f = self.fields.get(code)
+        if f is None:
+            return ValidationResult(False, "field not registered", {"code": code})
+        with self._trace(code) as span:
+            r = self._checked(code, lambda resolve: self._set_one(code, f, resolve(), value))
+        if span is not None:
+            r.details["trace"] = span.summary()
+        self._log(code, r.message)
+        return r
+
+    def _set_one(self, code: str, f, el, value) -> ValidationResult:
+        if el is None:
+            return ValidationResult(False, "field not found", {"code": code})
+        with self._trace(code, "set_value"):
+            ok, msg = f.set_value(el, value)
+        return ValidationResult(ok, msg, {"code": code})
+
+    def fill(self, values: Dict[str, object]) -> Tuple[bool, Dict[str, ValidationResult]]:
+        results: Dict[str, ValidationResult] = {}
+        bulk = []
+        fallback = []
+        for code, value in values.items():
+            f = self.fields.get(code)
+            if f is None:
+                results[code] = ValidationResult(False, "field not registered", {"code": code})
+            elif value is None or not f.BULK_KIND:
+                fallback.append(code)
+            else:
+                bulk.append([code, f.BULK_KIND, bool(value) if f.BULK_KIND == "checkbox" else str(value)])
+        if bulk:
+            raw = {}
+            with self._trace(phase="fill"):
+                try:
+                    raw = fill_fields(self.client.driver, bulk)
+                except Exception as e:
+                    self._log("*", f"bulk fill failed, falling back to per-field input: {e}")
+            for code, _, _ in bulk:
+                res = raw.get(code) or {}
+                if res.get("ok"):
+                    results[code] = ValidationResult(True, str(res.get("reason") or "value set"), {"code": code, "bulk": True})
+                    self._log(code, results[code].message)
+                else:
+                    if res:
+                        self._log(code, f"bulk fill rejected: {res.get('reason')}")
+                    fallback.append(code)
+        for code in fallback:
+            results[code] = self.set_value(code, values[code])
+        ordered = {code: results[code] for code in values}
+        return all(r.ok for r in ordered.values()), ordered
+
+    def verify_persisted(self, entity: str, records: Dict[str, Dict[str, object]]) -> Tuple[bool, Dict[str, Dict[str, ValidationResult]]]:
+        columns = {code: self._specs.get(code, {}).get("column") or code for values in records.values() for code in values}
+        with self._trace(phase="verify"):
+            rows = self.client.data.fetch_records(entity, list(records), sorted(set(columns.values())))
+        results: Dict[str, Dict[str, ValidationResult]] = {}
+        for record_id, values in records.items():
+            row = rows.get(str(record_id))
+            out: Dict[str, ValidationResult] = {}
+            for code, expected in values.items():
+                column = columns[code]
+                if row is None:
+                    r = ValidationResult(False, f"record {record_id} not found in {entity}", {"code": code})
+                else:
+                    actual = read_column(row, column)
+                    if values_match(expected, actual):
+                        r = ValidationResult(True, "value persisted", {"code": code, "column": column})
+                    else:
+                        r = ValidationResult(False, f"persisted value mismatch: expected {expected!r}, got {actual!r}", {"code": code, "column": column, "actual": actual})
+                out[code] = r
+                self._log(code, r.message)
+            results[str(record_id)] = out
+        return all(r.ok for out in results.values() for r in out.values()), results
+
+    def check_all(self, use_snapshot: bool = False) -> Tuple[bool, Dict[str, ValidationResult]]:
         results: Dict[str, ValidationResult] = {}
         all_ok = True
+        snaps = None
+        if use_snapshot:
+            with self._trace(phase="snapshot"):
+                snaps = self.client.collect_snapshot([(code, f.CONTROL_SELECTOR) for code, f in self.fields.items()])
+            if snaps is None:
+                self._log("*", "snapshot unavailable, falling back to live checks")
+        elements = self._resolve_many(list(self.fields)) if snaps is None else {}
         for code, f in self.fields.items():
-            el = self.client.get_field_fresh(code)
-            if el is None:
-                r = ValidationResult(False, "field not found", {"code": code})
-            else:
-                r = f.check(el)
+            started = time.time()
+            with self._trace(code) as span:
+                if snaps is not None and code in snaps:
+                    r = self._checked(code, lambda resolve: f.check_snapshot(snaps[code], resolve_element=resolve))
+                else:
+                    r = self._checked(code, lambda resolve: self._check_one(code, f, resolve()), elements)
+            if span is not None:
+                r.details["trace"] = span.summary()
             results[code] = r
             self._log(code, r.message)
+            self._emit(code, r, started)
             if not r.ok:
                 all_ok = False
         return all_ok, results
 
-    def await_check_all(self, timeout_per_field_sec: int = 30) -> Tuple[bool, Dict[str, ValidationResult]]:
+    @staticmethod
+    def _check_one(code: str, f, el, message: str = "field not found", timeout_sec: Optional[float] = None) -> ValidationResult:
+        if el is None:
+            return ValidationResult(False, message, {"code": code})
+        return f.check(el, timeout_sec=timeout_sec)
+
+    def _capture_records(self):
+        with self._trace(phase="snapshot"):
+            snaps = self.client.collect_snapshot([(code, f.CONTROL_SELECTOR) for code, f in self.fields.items()], with_html=True)
+        if snaps is None:
+            raise RuntimeError("cannot capture field snapshots")
+        return snaps, {code: snapshot_record(snap, self._specs.get(code)) for code, snap in snaps.items()}
+
+    def record_baseline(self, store: SnapshotStore, build: Optional[str] = None) -> Tuple[bool, Dict[str, ValidationResult]]:
+        build = build or self.client.detect_build()
+        snaps, records = self._capture_records()
         results: Dict[str, ValidationResult] = {}
-        all_ok = True
         for code, f in self.fields.items():
-            r = f.await_for_check(
-                resolve_element=lambda c=code: self.client.get_field_fresh(c),
-                timeout_sec=timeout_per_field_sec
-            )
+            with self._trace(code):
+                r = self._checked(code, lambda resolve: f.check_snapshot(snaps[code], resolve_element=resolve))
+            records[code]["result"] = {"ok": r.ok, "message": r.message}
+            results[code] = r
+            self._log(code, r.message)
+        store.save(self.name, build, records)
+        self._log("*", f"baseline recorded for build {build}: {len(records)} field(s)")
+        return all(r.ok for r in results.values()), results
+
+    def check_all_replay(self, store: SnapshotStore, build: Optional[str] = None) -> Tuple[bool, Dict[str, ValidationResult]]:
+        build = build or self.client.detect_build()
+        baseline = store.load(self.name, build)
+        if baseline is None:
+            self._log("*", f"no baseline for build {build}, recording one")
+            return self.record_baseline(store, build)
+        snaps, records = self._capture_records()
+        diff = diff_records(baseline, records)
+        results: Dict[str, ValidationResult] = {}
+        for code, f in self.fields.items():
+            prev = (baseline.get(code) or {}).get("result") or {}
+            if diff.get(code) == "unchanged" and prev.get("ok"):
+                r = f.check_snapshot(snaps[code], expensive=False)
+                if r.ok and f.has_expensive_checks():
+                    r.details["replayed"] = True
+            else:
+                with self._trace(code) as span:
+                    r = self._checked(code, lambda resolve: f.check_snapshot(snaps[code], resolve_element=resolve))
+                r.details["snapshot"] = diff.get(code)
+                if span is not None:
+                    r.details["trace"] = span.summary()
+            results[code] = r
+            self._log(code, r.message)
+        return all(r.ok for r in results.values()), results
+
+    def check_html(self, html: Optional[str] = None) -> Tuple[bool, Dict[str, ValidationResult]]:
+        if html is None:
+            html = getattr(self.client, "page_html", None)
+        if not html:
+            raise ValueError("no page HTML to validate")
+        snaps = collect_static_snapshot(html, [(code, f.CONTROL_SELECTOR) for code, f in self.fields.items()])
+        results: Dict[str, ValidationResult] = {}
+        for code, f in self.fields.items():
+            r = f.check_snapshot(snaps[code], expensive=False)
+            if r.ok and f.has_expensive_checks():
+                r.details["interactive_skipped"] = "lookup options need a browser"
+            results[code] = r
+            self._log(code, r.message)
+        return all(r.ok for r in results.values()), results
+
+    def _check_batched(self, attr: str, phase: str, batch, read_one, judge) -> Tuple[bool, Dict[str, ValidationResult]]:
+        codes = [code for code, f in self.fields.items() if getattr(f, attr) is not None]
+        values = None
+        if codes:
+            with self._trace(phase=phase):
+                try:
+                    values = batch(self.client.reader, codes)
+                except Exception as e:
+                    self._log("*", f"batched {phase} lookup failed, checking field by field: {e}")
+        results: Dict[str, ValidationResult] = {}
+        for code in codes:
+            f = self.fields[code]
+            if values is not None:
+                r = judge(f, values.get(code))
+            else:
+                r = self._checked(code, lambda resolve: (lambda el: judge(f, None if el is None else read_one(f, el)))(resolve()))
             results[code] = r
             self._log(code, r.message)
+        return all(r.ok for r in results.values()), results
+
+    def check_titles(self) -> Tuple[bool, Dict[str, ValidationResult]]:
+        return self._check_batched(
+            "title",
+            "title",
+            resolve_labels,
+            lambda f, el: resolve_label(el, self.client.driver),
+            lambda f, label: f.check_title_text(label),
+        )
+
+    def check_readonly_all(self) -> Tuple[bool, Dict[str, ValidationResult]]:
+        return self._check_batched(
+            "readonly",
+            "readonly",
+            READONLY_DETECTOR.check_many,
+            lambda f, el: f.readonly_detector.check(el),
+            lambda f, verdict: f.check_readonly_verdict(verdict),
+        )
+
+    def _await_check_all_pooled(self, pool: SessionPool, timeout_per_field_sec: int, **schedule) -> Tuple[bool, Dict[str, ValidationResult]]:
+        shards = [(session, codes) for session, codes in zip(pool.sessions, self._partition(len(pool.sessions))) if codes]
+        merged: Dict[str, ValidationResult] = {}
+        with ThreadPoolExecutor(max_workers=len(shards)) as ex:
+            futures = [
+                ex.submit(lambda s=session, c=codes: self.for_client(s, c).await_check_all(timeout_per_field_sec, **schedule))
+                for session, codes in shards
+            ]
+            for fut in futures:
+                merged.update(fut.result()[1])
+        results = {code: merged[code] for code in self.fields if code in merged}
+        return all(r.ok for r in results.values()), results
+
+    def _page_rendered(self) -> bool:
+        try:
+            return bool(self.client.reader.execute_script("return !!document.querySelector('[element-name]');"))
+        except Exception:
+            return False
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        return None if deadline is None else max(0.0, deadline - time.time())
+
+    def _check_pending(
+        self,
+        pending: List[str],
+        stable: Dict[str, int],
+        attempts: Dict[str, int],
+        stable_polls: int,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, ValidationResult]:
+        with self._trace(phase="snapshot"):
+            snaps = self.client.collect_snapshot([(code, self.fields[code].CONTROL_SELECTOR) for code in pending])
+        elements = self._resolve_many(pending) if snaps is None else {}
+        out: Dict[str, ValidationResult] = {}
+        for code in pending:
+            f = self.fields[code]
+            staged = f.has_expensive_checks()
+            with self._trace(code) as span:
+                if snaps is not None:
+                    snap = snaps[code]
+                    if not snap.found:
+                        stable[code] = 0
+                        r = ValidationResult(False, NOT_FOUND_MESSAGE, {"code": code})
+                    elif staged and stable.get(code, 0) < stable_polls:
+                        r = f.check_snapshot(snap, expensive=False)
+                        stable[code] = stable.get(code, 0) + 1 if r.ok else 0
+                        if r.ok:
+                            r = ValidationResult(False, "waiting for field to stabilize", {"code": code})
+                    else:
+                        r = self._checked(code, lambda resolve: f.check_snapshot(snap, resolve_element=resolve, timeout_sec=self._remaining(deadline)))
+                        attempts[code] = attempts.get(code, 0) + 1
+                        if not r.ok:
+                            stable[code] = 0
+                else:
+                    r = self._checked(code, lambda resolve: self._check_one(code, f, resolve(), NOT_FOUND_MESSAGE, self._remaining(deadline)), elements)
+                    if r.message != NOT_FOUND_MESSAGE:
+                        attempts[code] = attempts.get(code, 0) + 1
+            if span is not None:
+                r.details["trace"] = span.summary()
+            out[code] = r
+        return out
+
+    def await_check_all(
+        self,
+        timeout_per_field_sec: int = 30,
+        pool: Optional[SessionPool] = None,
+        poll_interval_sec: float = 0.25,
+        render_grace_sec: Optional[float] = None,
+        stable_polls: int = 2,
+        max_attempts: int = 3,
+    ) -> Tuple[bool, Dict[str, ValidationResult]]:
+        if pool is not None and len(pool) > 1 and len(self.fields) > 1:
+            return self._await_check_all_pooled(
+                pool,
+                timeout_per_field_sec,
+                poll_interval_sec=poll_interval_sec,
+                render_grace_sec=render_grace_sec,
+                stable_polls=stable_polls,
+                max_attempts=max_attempts,
+            )
+        start = time.time()
+        deadline = start + timeout_per_field_sec
+        grace = min(timeout_per_field_sec, 10) if render_grace_sec is None else render_grace_sec
+        pending: List[str] = list(self.fields)
+        latest: Dict[str, ValidationResult] = {}
+        stable: Dict[str, int] = {}
+        attempts: Dict[str, int] = {}
+        polls: Dict[str, int] = {}
+        trips: Dict[str, int] = {}
+        seen_any = False
+        while pending:
+            for code, r in self._check_pending(pending, stable, attempts, stable_polls, deadline).items():
+                latest[code] = r
+                polls[code] = polls.get(code, 0) + 1
+                trips[code] = trips.get(code, 0) + int((r.details.get("trace") or {}).get("round_trips", 0))
+                if r.message != NOT_FOUND_MESSAGE:
+                    seen_any = True
+                if r.ok:
+                    pending.remove(code)
+                    self._log(code, r.message)
+                    self._emit(code, r, start, polls[code], trips[code])
+                elif self.fields[code].has_expensive_checks() and attempts.get(code, 0) >= max_attempts:
+                    pending.remove(code)
+            now = time.time()
+            if not pending or now >= deadline:
+                break
+            if not seen_any and now - start >= grace and not self._page_rendered():
+                for code in pending:
+                    latest[code] = ValidationResult(False, "page not rendered: no [element-name] hosts", {"code": code})
+                break
+            time.sleep(min(poll_interval_sec, max(0.0, deadline - now)))
+        results: Dict[str, ValidationResult] = {}
+        for code in self.fields:
+            r = latest.get(code) or ValidationResult(False, NOT_FOUND_MESSAGE, {"code": code})
+            results[code] = r
             if not r.ok:
-                all_ok = False
-        return all_ok, results
+                self._log(code, r.message)
+                self._emit(code, r, start, polls.get(code, 0), trips.get(code, 0))
+        return all(r.ok for r in results.values()), results
@@ -0,0 +1,59 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from .auth_page import CreatioAuthPage
+
+
+class SessionPool:
+    def __init__(self, client: CreatioAuthPage, size: int = 2, debug: bool = False):
+        self.client = client
+        self.size = max(1, int(size))
+        self.debug = debug
+        self.sessions: List[CreatioAuthPage] = [client]
+        self._spawned: List[CreatioAuthPage] = []
+
+    def _log(self, msg: str):
+        if self.debug:
+            print(f"[session-pool] {msg}", file=sys.stderr, flush=True)
+
+    def _spawn(self) -> Optional[CreatioAuthPage]:
+        session = None
+        try:
+            session = self.client.clone()
+            session.login()
+            session.load_page()
+            return session
+        except Exception as e:
+            self._log(f"session start failed: {e}")
+            if session is not None:
+                session.close()
+            return None
+
+    def open(self) -> "SessionPool":
+        extra = self.size - len(self.sessions)
+        if extra <= 0:
+            return self
+        with ThreadPoolExecutor(max_workers=extra) as ex:
+            started = list(ex.map(lambda _: self._spawn(), range(extra)))
+        for s in started:
+            if s is not None:
+                self.sessions.append(s)
+                self._spawned.append(s)
+        self._log(f"sessions ready: {len(self.sessions)}/{self.size}")
+        return self
+
+    def close(self):
+        for s in self._spawned:
+            s.close()
+        self.sessions = [self.client]
+        self._spawned = []
+
+    def __enter__(self) -> "SessionPool":
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.sessions)
@@ -0,0 +1,33 @@
+import json
+from typing import Any
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class CdpReader:
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+
+    def _evaluate(self, expression: str, await_promise: bool) -> Any:
+        res = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": True,
+            "awaitPromise": await_promise,
+            "userGesture": False,
+        }) or {}
+        if res.get("exceptionDetails"):
+            d = res["exceptionDetails"]
+            text = ((d.get("exception") or {}).get("description")) or d.get("text") or "script error"
+            raise RuntimeError(f"Runtime.evaluate failed: {text}")
+        return (res.get("result") or {}).get("value")
+
+    def execute_script(self, script: str, *args) -> Any:
+        return self._evaluate(f"(function(){{{script}\n}}).apply(null, {json.dumps(list(args))})", False)
+
+    def execute_async_script(self, script: str, *args) -> Any:
+        expression = (
+            "new Promise(function(__resolve){"
+            f"(function(){{{script}\n}}).apply(null, {json.dumps(list(args))}.concat([__resolve]));"
+            "})"
+        )
+        return self._evaluate(expression, True)
@@ -0,0 +1,144 @@
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}(:\d{2})?)?$")
+_GUID_RE = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+
+
+_BOOL_TEXT = {"true": True, "1": True, "false": False, "0": False}
+
+
+def odata_literal(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    s = str(value)
+    if _GUID_RE.match(s):
+        return s
+    return "'" + s.replace("'", "''") + "'"
+
+
+def split_columns(columns: Iterable[str]) -> Tuple[List[str], Dict[str, List[str]]]:
+    select: List[str] = []
+    expand: Dict[str, List[str]] = {}
+    for c in columns:
+        if "." in c:
+            nav, col = c.split(".", 1)
+            expand.setdefault(nav, [])
+            if col not in expand[nav]:
+                expand[nav].append(col)
+        elif c not in select:
+            select.append(c)
+    return select, expand
+
+
+def read_column(row: Dict[str, Any], column: str) -> Any:
+    value: Any = row
+    for part in column.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def values_match(expected: Any, actual: Any) -> bool:
+    if expected is None or expected == "":
+        return actual is None or actual == ""
+    if actual is None:
+        return False
+    if isinstance(expected, bool) or isinstance(actual, bool):
+        e = _BOOL_TEXT.get(str(expected).strip().lower())
+        a = _BOOL_TEXT.get(str(actual).strip().lower())
+        return e is not None and e == a
+    if isinstance(expected, (int, float)) or isinstance(actual, (int, float)):
+        try:
+            return abs(float(expected) - float(actual)) < 1e-9
+        except (TypeError, ValueError):
+            return False
+    e, a = str(expected).strip(), str(actual).strip()
+    if _GUID_RE.match(e):
+        return e.lower() == a.lower()
+    if _DATE_RE.match(e) and a.startswith(e):
+        return True
+    return e == a
+
+
+class CreatioDataClient:
+    def __init__(
+        self,
+        session: requests.Session,
+        base_url: str,
+        odata_path: str = "/0/odata",
+        timeout_sec: int = 30,
+        pool_size: int = 10,
+        batch_size: int = 40,
+    ):
+        self.session = requests.Session()
+        self.session.cookies = session.cookies
+        self.session.headers.update(session.headers)
+        self.session.auth = session.auth
+        self.session.proxies.update(session.proxies)
+        self.session.verify = session.verify
+        self.session.cert = session.cert
+        self.base_url = base_url.rstrip("/")
+        self.odata_path = "/" + odata_path.strip("/")
+        self.timeout_sec = timeout_sec
+        self.batch_size = max(1, int(batch_size))
+        adapter = HTTPAdapter(pool_connections=max(1, int(pool_size)), pool_maxsize=max(1, int(pool_size)))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _headers(self) -> Dict[str, str]:
+        headers = {"Accept": "application/json"}
+        token = self.session.cookies.get("BPMCSRF")
+        if token:
+            headers["BPMCSRF"] = token
+        return headers
+
+    def _url(self, entity: str) -> str:
+        return f"{self.base_url}{self.odata_path}/{entity}"
+
+    def query(self, entity: str, params: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        url: Optional[str] = self._url(entity)
+        rows: List[Dict[str, Any]] = []
+        while url:
+            resp = self.session.get(url, params=params, headers=self._headers(), timeout=self.timeout_sec)
+            if resp.status_code != 200:
+                raise RuntimeError(f"OData request failed: HTTP {resp.status_code}, body={resp.text[:2000]}")
+            data = resp.json()
+            rows.extend(data.get("value", []))
+            next_link = data.get("@odata.nextLink")
+            url = urljoin(url, next_link) if next_link else None
+            params = None
+        return rows
+
+    def fetch_column(self, entity: str, column: str, filter: Optional[str] = None) -> List[str]:
+        params = {"$select": column}
+        if filter:
+            params["$filter"] = filter
+        out: List[str] = []
+        for row in self.query(entity, params):
+            v = row.get(column)
+            if v is not None:
+                out.append(str(v))
+        return out
+
+    def fetch_records(self, entity: str, ids: Iterable[str], columns: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        ids = list(dict.fromkeys(ids))
+        select, expand = split_columns(["Id", *columns])
+        params = {"$select": ",".join(select)}
+        if expand:
+            params["$expand"] = ",".join(f"{nav}($select={','.join(cols)})" for nav, cols in expand.items())
+        out: Dict[str, Dict[str, Any]] = {}
+        for i in range(0, len(ids), self.batch_size):
+            chunk = ids[i:i + self.batch_size]
+            params["$filter"] = " or ".join(f"Id eq {odata_literal(x)}" for x in chunk)
+            for row in self.query(entity, dict(params)):
+                out[str(row.get("Id")).lower()] = row
+        return {str(x): out.get(str(x).lower()) for x in ids}
@@ -1,9 +1,37 @@
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional, Union
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 
+LABEL_SELECTORS = [
+    ".crt-input-label",
+    "label",
+    ".crt-checkbox-label",
+    ".crt-base-input-width-holder-label",
+    ".mat-form-field-label",
+]
+
+REQUIRED_LABEL_SELECTOR = ".crt-input-label, label, .crt-base-input-width-holder-label"
+
+
+def per_host_js(prelude: str, fn: str) -> str:
+    return prelude + """
+var out = {};
+arguments[0].forEach(function(it){
+  var host = it[1] || document.querySelector('[element-name="' + CSS.escape(it[0]) + '"]');
+  out[it[0]] = host ? %s(host) : null;
+});
+return out;
+""" % fn
+
+
+def run_per_host(driver: WebDriver, script: str, targets: Union[Dict[str, Optional[WebElement]], Iterable[str]]) -> Dict[str, Any]:
+    items = list(targets.items()) if isinstance(targets, dict) else [(code, None) for code in targets]
+    values = driver.execute_script(script, [[code, el] for code, el in items]) or {}
+    return {code: values.get(code) for code, _ in items}
+
+
 def scroll_into_view(driver: WebDriver, el: WebElement):
     try:
         driver.execute_script("arguments[0].scrollIntoView({block:'center',inline:'center'});", el)
@@ -12,15 +40,8 @@ def scroll_into_view(driver: WebDriver, el: WebElement):
 
 
 def find_labels(container: WebElement) -> List[WebElement]:
-    sels = [
-        ".crt-input-label",
-        "label",
-        ".crt-checkbox-label",
-        ".crt-base-input-width-holder-label",
-        ".mat-form-field-label",
-    ]
     out: List[WebElement] = []
-    for s in sels:
+    for s in LABEL_SELECTORS:
         try:
             out.extend(container.find_elements(By.CSS_SELECTOR, s))
         except Exception:
@@ -28,6 +49,15 @@ def find_labels(container: WebElement) -> List[WebElement]:
     return out
 
 
+def xpath_literal(value: str) -> str:
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{p}'" for p in parts) + ")"
+
+
 def outer_html(driver: WebDriver, el: WebElement, max_len: int = 1200) -> str:
     try:
         html = driver.execute_script("return arguments[0].outerHTML;", el) or ""
@@ -0,0 +1,41 @@
+from typing import Any, Dict, List
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+FILL_JS = """
+var items = arguments[0];
+var inputSetter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+var areaSetter = Object.getOwnPropertyDescriptor(HTMLTextAreaElement.prototype, 'value').set;
+var out = {};
+function fire(el, name){ el.dispatchEvent(new Event(name, {bubbles: true})); }
+items.forEach(function(it){
+  var code = it[0], kind = it[1], value = it[2];
+  var host = document.querySelector('[element-name="' + CSS.escape(code) + '"]');
+  if (!host) { out[code] = {ok: false, reason: 'field not found'}; return; }
+  if (kind === 'checkbox') {
+    var box = host.querySelector("mat-checkbox input[type='checkbox']");
+    if (!box) { out[code] = {ok: false, reason: 'checkbox not found'}; return; }
+    if (box.disabled) { out[code] = {ok: false, reason: 'checkbox is disabled'}; return; }
+    if (!!box.checked === !!value) { out[code] = {ok: true, reason: 'value unchanged'}; return; }
+    box.click();
+    out[code] = {ok: !!box.checked === !!value, reason: 'value toggled'};
+    return;
+  }
+  var ed = host.querySelector('input, textarea');
+  if (!ed) { out[code] = {ok: false, reason: 'editable control not found'}; return; }
+  if (ed.readOnly || ed.disabled) { out[code] = {ok: false, reason: 'control is readonly'}; return; }
+  ed.focus();
+  (ed.tagName === 'TEXTAREA' ? areaSetter : inputSetter).call(ed, String(value));
+  fire(ed, 'input');
+  var accepted = ed.value === String(value);
+  fire(ed, 'change');
+  ed.blur();
+  fire(ed, 'blur');
+  out[code] = {ok: accepted, reason: accepted ? 'value set' : 'value rejected by control'};
+});
+return out;
+"""
+
+
+def fill_fields(driver: WebDriver, items: List[List[Any]]) -> Dict[str, Dict[str, Any]]:
+    return driver.execute_script(FILL_JS, items) or {}
@@ -1,9 +1,47 @@
-from typing import Optional
+import json
+from typing import Dict, Iterable, Optional, Union
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
 
-from .dom_queries import find_labels
+from .dom_queries import find_labels, per_host_js, run_per_host, LABEL_SELECTORS
+
+
+LABEL_JS = """
+function crtText(n){
+  var t = (n.innerText || '').trim();
+  if (t) return t;
+  return (n.textContent || '').trim();
+}
+function resolveLabel(host){
+  var inp = host.querySelector("input, textarea, [role='combobox']");
+  if (inp) {
+    var a = (inp.getAttribute('aria-label') || '').trim();
+    if (a) return a;
+    var lb = (inp.getAttribute('aria-labelledby') || '').trim();
+    if (lb) {
+      var parts = [];
+      lb.split(/\\s+/).forEach(function(id){
+        var ref = document.getElementById(id);
+        if (ref) { var t = crtText(ref); if (t) parts.push(t); }
+      });
+      var joined = parts.join(' ').trim();
+      if (joined) return joined;
+    }
+  }
+  var sels = %s;
+  for (var i = 0; i < sels.length; i++) {
+    var nodes = host.querySelectorAll(sels[i]);
+    for (var j = 0; j < nodes.length; j++) {
+      var t = crtText(nodes[j]);
+      if (t) return t;
+    }
+  }
+  return '';
+}
+""" % json.dumps(LABEL_SELECTORS)
+
+LABELS_JS = per_host_js(LABEL_JS, "resolveLabel")
 
 
 def safe_text(el: WebElement) -> str:
@@ -50,3 +88,8 @@ def resolve_label(container: WebElement, driver: WebDriver) -> str:
         if t:
             return t
     return ""
+
+
+def resolve_labels(driver: WebDriver, targets: Union[Dict[str, Optional[WebElement]], Iterable[str]]) -> Dict[str, Optional[str]]:
+    labels = run_per_host(driver, LABELS_JS, targets)
+    return {code: (None if v is None else str(v).strip()) for code, v in labels.items()}
@@ -8,13 +8,167 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from .dom_queries import scroll_into_view, find_trigger
+from .waits import ensure_script_timeout
+
+
+HARVEST_JS = """
+var done = arguments[arguments.length - 1];
+var quietMs = arguments[0], timeoutMs = arguments[1];
+var PANEL = '.cdk-overlay-pane .mat-autocomplete-panel.mat-autocomplete-visible';
+var OPTION = 'mat-option, .mat-option';
+var TEXT = '.mat-option .chip-text, .mat-option .mat-option-text, .mat-option [crttextoverflowtitle]';
+var seen = new Set(), order = [];
+var finished = false, waiting = false, settling = false, quiet = null, hard = null, obs = null;
+function collect(){
+  var added = 0;
+  document.querySelectorAll(PANEL).forEach(function(p){
+    p.querySelectorAll(TEXT).forEach(function(n){
+      var t = (n.innerText || n.textContent || '').trim();
+      if (t && !seen.has(t)) { seen.add(t); order.push(t); added++; }
+    });
+  });
+  return added;
+}
+function covered(p){
+  var r = p.getBoundingClientRect(), y = r.top + 1, end = r.bottom - 1;
+  var rows = Array.prototype.map.call(p.querySelectorAll(OPTION), function(o){ return o.getBoundingClientRect(); });
+  rows = rows.filter(function(b){ return b.height > 0; }).sort(function(a, b){ return a.top - b.top; });
+  for (var i = 0; i < rows.length && y < end; i++) {
+    if (rows[i].top > y + 1) return false;
+    if (rows[i].bottom > y) y = rows[i].bottom;
+  }
+  return y >= end;
+}
+function step(){
+  var moved = false;
+  document.querySelectorAll(PANEL).forEach(function(p){
+    var before = p.scrollTop;
+    p.scrollTop = Math.min(before + Math.max(p.clientHeight, 1), p.scrollHeight);
+    if (p.scrollTop !== before) moved = true;
+    p.dispatchEvent(new Event('scroll'));
+  });
+  return moved;
+}
+function frame(fn){
+  var fired = false;
+  function go(){ if (!fired) { fired = true; fn(); } }
+  requestAnimationFrame(go);
+  setTimeout(go, 50);
+}
+function finish(complete){
+  if (finished) return;
+  finished = true;
+  if (obs) obs.disconnect();
+  clearTimeout(quiet);
+  clearTimeout(hard);
+  done({items: order, complete: complete});
+}
+function pump(){
+  if (finished) return;
+  clearTimeout(quiet);
+  waiting = settling = false;
+  collect();
+  if (step()) {
+    waiting = true;
+    frame(function(){
+      var p = document.querySelector(PANEL);
+      if (waiting && p && covered(p)) pump();
+    });
+    quiet = setTimeout(function(){ if (waiting) pump(); }, quietMs);
+  } else {
+    settling = true;
+    quiet = setTimeout(function(){ if (settling) finish(true); }, quietMs);
+  }
+}
+document.querySelectorAll(PANEL).forEach(function(p){ p.scrollTop = 0; });
+collect();
+obs = new MutationObserver(function(){
+  var added = collect();
+  if (waiting) { waiting = false; frame(pump); }
+  else if (settling && added) { settling = false; frame(pump); }
+});
+obs.observe(document.querySelector('.cdk-overlay-container') || document.body, {childList: true, subtree: true, characterData: true});
+hard = setTimeout(function(){ finish(false); }, timeoutMs);
+frame(pump);
+"""
+
+SELECT_JS = """
+var done = arguments[arguments.length - 1];
+var wanted = String(arguments[0]), quietMs = arguments[1], timeoutMs = arguments[2], panelMs = arguments[3];
+var PANEL = '.cdk-overlay-pane .mat-autocomplete-panel.mat-autocomplete-visible';
+var TEXT = '.chip-text, .mat-option-text, [crttextoverflowtitle]';
+function norm(s){ return String(s || '').replace(/\\s+/g, ' ').trim().toLowerCase(); }
+var target = norm(wanted);
+var finished = false, quiet = null, hard = null, obs = null, misses = 0;
+var loose = false, looseAt = null, started = Date.now();
+function optionText(o){
+  var n = o.querySelector(TEXT) || o;
+  return (n.innerText || n.textContent || '').trim();
+}
+function find(panel){
+  var opts = panel.querySelectorAll('mat-option, .mat-option');
+  var candidate = null;
+  for (var i = 0; i < opts.length; i++) {
+    var t = optionText(opts[i]);
+    if (t === wanted) return opts[i];
+    if (!candidate && norm(t) === target) candidate = opts[i];
+  }
+  if (candidate && looseAt === null) looseAt = panel.scrollTop;
+  return loose ? candidate : null;
+}
+function finish(res){
+  if (finished) return;
+  finished = true;
+  if (obs) obs.disconnect();
+  clearTimeout(quiet);
+  clearTimeout(hard);
+  done(res);
+}
+function attempt(){
+  var panel = document.querySelector(PANEL);
+  if (!panel) {
+    if (Date.now() - started >= panelMs) finish({ok: false, reason: 'filtered panel did not appear'});
+    else arm();
+    return;
+  }
+  var o = find(panel);
+  if (o) {
+    var text = optionText(o);
+    o.scrollIntoView({block: 'nearest'});
+    o.click();
+    finish({ok: true, text: text, exact: text === wanted});
+    return;
+  }
+  if (loose) { finish({ok: false, reason: 'option not found in filtered panel'}); return; }
+  var before = panel.scrollTop;
+  panel.scrollTop = Math.min(before + Math.max(panel.clientHeight, 1), panel.scrollHeight);
+  panel.dispatchEvent(new Event('scroll'));
+  if (panel.scrollTop !== before) { arm(); return; }
+  misses++;
+  if (misses < 2) { arm(); return; }
+  if (looseAt === null) { finish({ok: false, reason: 'option not found in filtered panel'}); return; }
+  loose = true;
+  panel.scrollTop = looseAt;
+  panel.dispatchEvent(new Event('scroll'));
+  arm();
+}
+function arm(){
+  clearTimeout(quiet);
+  quiet = setTimeout(attempt, quietMs);
+}
+obs = new MutationObserver(function(){ misses = 0; arm(); });
+obs.observe(document.body, {childList: true, subtree: true, characterData: true});
+hard = setTimeout(function(){ finish({ok: false, reason: 'timeout waiting for filtered panel'}); }, timeoutMs);
+arm();
+"""
 
 
 class OverlayService:
-    def __init__(self, driver: WebDriver, timeout_sec: int = 20, logger=None):
+    def __init__(self, driver: WebDriver, timeout_sec: int = 20, logger=None, reader=None):
         self.driver = driver
         self.timeout_sec = timeout_sec
         self.logger = logger
+        self.reader = reader if reader is not driver else None
 
     def _log(self, msg: str):
         if self.logger:
@@ -72,7 +226,30 @@ return Array.from(set);
         ) or []
         return [str(x) for x in items]
 
+    def harvest(self, quiet_ms: int = 300) -> Tuple[List[str], bool]:
+        res = None
+        if self.reader is not None:
+            try:
+                res = self.reader.execute_async_script(HARVEST_JS, quiet_ms, self.timeout_sec * 1000)
+            except Exception as e:
+                self._log(f"reader harvest failed, using WebDriver: {e}")
+        if res is None:
+            ensure_script_timeout(self.driver, self.timeout_sec + 5)
+            res = self.driver.execute_async_script(HARVEST_JS, quiet_ms, self.timeout_sec * 1000)
+        res = res or {}
+        return [str(x) for x in res.get("items") or []], bool(res.get("complete"))
+
     def read_until_stable(self) -> Tuple[bool, List[str], str]:
+        try:
+            texts, complete = self.harvest()
+            if complete and texts:
+                self._log(f"options harvested: {len(texts)}")
+                return True, texts, "options collected"
+            if not complete:
+                self._log(f"harvest timed out after {len(texts)} option(s)")
+                return False, texts, f"option list not fully read within {self.timeout_sec}s ({len(texts)} collected)"
+        except Exception as e:
+            self._log(f"harvest failed, falling back to scroll polling: {e}")
         deadline = time.time() + self.timeout_sec
         last_len = -1
         stable_ticks = 0
@@ -103,8 +280,19 @@ return Array.from(set);
             except Exception:
                 html = ""
             return False, [], f"no options; overlay html: {html[:800]}"
+        if stable_ticks < 2:
+            return False, texts, f"option list did not stabilize within {self.timeout_sec}s ({len(texts)} collected)"
         return True, texts, "options collected"
 
+    def select_typed(self, value: str, quiet_ms: int = 300, panel_timeout_sec: float = 3.0) -> Tuple[bool, str]:
+        ensure_script_timeout(self.driver, self.timeout_sec + 5)
+        panel_ms = int(min(panel_timeout_sec, self.timeout_sec) * 1000)
+        res = self.driver.execute_async_script(SELECT_JS, value, quiet_ms, self.timeout_sec * 1000, panel_ms) or {}
+        if res.get("ok"):
+            self._log(f"option selected: {res.get('text')}" + ("" if res.get("exact") else " (case/whitespace-insensitive match)"))
+            return True, "value set"
+        return False, str(res.get("reason") or "option not selected")
+
     def close(self):
         try:
             body = self.driver.find_element(By.TAG_NAME, "body")
@@ -0,0 +1,71 @@
+import json
+from typing import Dict, List, Optional, Tuple
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from ..models.snapshot import FieldSnapshot
+from .dom_queries import REQUIRED_LABEL_SELECTOR
+from .label_resolver import LABEL_JS
+from .readonly_detector import READONLY_STATE_JS
+
+
+SNAPSHOT_JS = LABEL_JS + READONLY_STATE_JS + """
+function requiredState(host, ed){
+  if (ed) {
+    if ((ed.getAttribute('aria-required') || '').trim().toLowerCase() === 'true') return true;
+    if (ed.hasAttribute('required')) return true;
+  }
+  var labels = host.querySelectorAll(%s);
+  for (var i = 0; i < labels.length; i++) {
+    if ((labels[i].getAttribute('class') || '').indexOf('crt-input-required') >= 0) return true;
+  }
+  return false;
+}
+function fieldSnapshot(host, probe){
+  var ed = host.querySelector('input, textarea') || host.querySelector("[role='combobox']");
+  var box = host.querySelector("mat-checkbox input[type='checkbox']");
+  return {
+    found: true,
+    tag: host.tagName.toLowerCase(),
+    control: probe ? !!host.querySelector(probe) : true,
+    label: resolveLabel(host),
+    readonly: readonlyState(host),
+    required: requiredState(host, ed),
+    value: ed && ed.value != null ? String(ed.value) : null,
+    checked: box ? !!box.checked : null
+  };
+}
+""" % json.dumps(REQUIRED_LABEL_SELECTOR)
+
+COLLECT_JS = SNAPSHOT_JS + """
+var specs = arguments[0], withHtml = !!arguments[1];
+var out = {};
+specs.forEach(function(s){
+  var host = document.querySelector('[element-name="' + CSS.escape(s[0]) + '"]');
+  out[s[0]] = host ? fieldSnapshot(host, s[1]) : {found: false};
+  if (host && withHtml) out[s[0]].html = host.outerHTML;
+});
+return out;
+"""
+
+
+def to_snapshot(code: str, raw: Optional[Dict]) -> FieldSnapshot:
+    raw = raw or {}
+    if not raw.get("found"):
+        return FieldSnapshot(code=code, found=False)
+    return FieldSnapshot(
+        code=code,
+        found=True,
+        tag=str(raw.get("tag") or ""),
+        control=bool(raw.get("control")),
+        label=str(raw.get("label") or ""),
+        readonly_state=raw.get("readonly") or {},
+        required=bool(raw.get("required")),
+        value=raw.get("value"),
+        checked=raw.get("checked"),
+        html=raw.get("html"),
+    )
+
+
+def collect_snapshot(driver: WebDriver, specs: List[Tuple[str, Optional[str]]], with_html: bool = False) -> Dict[str, FieldSnapshot]:
+    raw = driver.execute_script(COLLECT_JS, [[code, probe] for code, probe in specs], with_html) or {}
+    return {code: to_snapshot(code, raw.get(code)) for code, _ in specs}
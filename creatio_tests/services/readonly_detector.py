@@ -1,6 +1,35 @@
-from typing import Optional, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 from selenium.webdriver.remote.webelement import WebElement
 
+from .dom_queries import per_host_js, run_per_host
+
+
+READONLY_STATE_JS = """
+function readonlyState(host){
+  function val(x){ return x == null ? null : String(x); }
+  var res = {
+    hostReadonly: val(host.getAttribute('readonly')),
+    hostDisabled: val(host.getAttribute('disabled')),
+    hasLockIcon: !!host.querySelector('.readonly-icon,[data-mat-icon-name="lock"],[title*="Non-editable"]'),
+    inputs: []
+  };
+  var nodes = host.querySelectorAll('input,textarea,select,[role="combobox"]');
+  nodes.forEach(function(n){
+    res.inputs.push({
+      readonlyAttr: val(n.getAttribute('readonly')),
+      disabledAttr: val(n.getAttribute('disabled')),
+      ariaReadonly: val(n.getAttribute('aria-readonly')),
+      ariaDisabled: val(n.getAttribute('aria-disabled')),
+      readOnlyProp: !!n.readOnly,
+      disabledProp: !!n.disabled
+    });
+  });
+  return res;
+}
+"""
+
+READONLY_MANY_JS = per_host_js(READONLY_STATE_JS, "readonlyState")
+
 
 class ReadonlyDetector:
     def __init__(self):
@@ -8,31 +37,15 @@ class ReadonlyDetector:
 
     def check(self, container: WebElement) -> Tuple[bool, str]:
         drv = container.parent
-        state = drv.execute_script(
-            """
-var host = arguments[0];
-function val(x){ return x == null ? null : String(x); }
-var res = {
-  hostReadonly: val(host.getAttribute('readonly')),
-  hostDisabled: val(host.getAttribute('disabled')),
-  hasLockIcon: !!host.querySelector('.readonly-icon,[data-mat-icon-name="lock"],[title*="Non-editable"]'),
-  inputs: []
-};
-var nodes = host.querySelectorAll('input,textarea,select,[role="combobox"]');
-nodes.forEach(function(n){
-  res.inputs.push({
-    readonlyAttr: val(n.getAttribute('readonly')),
-    disabledAttr: val(n.getAttribute('disabled')),
-    ariaReadonly: val(n.getAttribute('aria-readonly')),
-    ariaDisabled: val(n.getAttribute('aria-disabled')),
-    readOnlyProp: !!n.readOnly,
-    disabledProp: !!n.disabled
-  });
-});
-return res;
-""",
-            container,
-        )
+        state = drv.execute_script(READONLY_STATE_JS + "return readonlyState(arguments[0]);", container)
+        return self.evaluate(state)
+
+    def check_many(self, driver, targets: Union[Dict[str, Optional[WebElement]], Iterable[str]]) -> Dict[str, Optional[Tuple[bool, str]]]:
+        states = run_per_host(driver, READONLY_MANY_JS, targets)
+        return {code: (None if state is None else self.evaluate(state)) for code, state in states.items()}
+
+    def evaluate(self, state: Optional[Dict[str, Any]]) -> Tuple[bool, str]:
+        state = state or {}
         def t(v: Optional[str]) -> bool:
             if v is None:
                 return False
@@ -79,3 +92,6 @@ return res;
             if inp_props_dis: reasons.append("input.disabled")
             return True, ", ".join(reasons) if reasons else "readonly signals"
         return False, "no readonly signals"
+
+
+READONLY_DETECTOR = ReadonlyDetector()
@@ -0,0 +1,82 @@
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..models.result import ValidationResult
+
+
+def result_record(
+    page: str,
+    code: str,
+    result: ValidationResult,
+    started_at: float,
+    ended_at: Optional[float] = None,
+    attempts: int = 1,
+    round_trips: Optional[int] = None,
+) -> Dict[str, Any]:
+    ended_at = time.time() if ended_at is None else ended_at
+    if round_trips is None:
+        round_trips = int((result.details.get("trace") or {}).get("round_trips", 0))
+    return {
+        "page": page,
+        "code": code,
+        "ok": result.ok,
+        "message": result.message,
+        "started_at": round(started_at, 6),
+        "ended_at": round(ended_at, 6),
+        "elapsed_sec": round(ended_at - started_at, 6),
+        "attempts": attempts,
+        "round_trips": round_trips,
+        "details": {k: v for k, v in result.details.items() if k not in ("code", "trace")},
+    }
+
+
+class ResultSink(ABC):
+    @abstractmethod
+    def write(self, record: Dict[str, Any]):
+        ...
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class JsonlResultSink(ResultSink):
+    def __init__(self, path: str, max_bytes: int = 0, backups: int = 5):
+        self.path = Path(path)
+        self.max_bytes = max(0, int(max_bytes))
+        self.backups = max(1, int(backups))
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.path, "a", encoding="utf-8")
+
+    def _rotate(self):
+        self._fh.close()
+        for i in range(self.backups - 1, 0, -1):
+            src = self.path.with_name(f"{self.path.name}.{i}")
+            if src.exists():
+                os.replace(src, self.path.with_name(f"{self.path.name}.{i + 1}"))
+        os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        self._fh = open(self.path, "a", encoding="utf-8")
+
+    def write(self, record: Dict[str, Any]):
+        line = json.dumps(record, default=str, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self.max_bytes and self._fh.tell() and self._fh.tell() + len(line) > self.max_bytes:
+                self._rotate()
+            self._fh.write(line)
+            self._fh.flush()
+
+    def close(self):
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.close()
@@ -0,0 +1,99 @@
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+class SessionCache:
+    def __init__(self, path: str = ".creatio_sessions", ttl_sec: int = 3600):
+        self.dir = Path(path)
+        self.ttl_sec = int(ttl_sec)
+
+    def _key(self, base_url: str, username: str) -> str:
+        return hashlib.sha256(f"{base_url.rstrip('/')}\n{username}".encode("utf-8")).hexdigest()[:32]
+
+    def _path(self, base_url: str, username: str, suffix: str) -> Path:
+        return self.dir / f"{self._key(base_url, username)}{suffix}"
+
+    def _ensure_dir(self):
+        self.dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        try:
+            os.chmod(self.dir, 0o700)
+        except OSError:
+            pass
+
+    @contextmanager
+    def lock(self, base_url: str, username: str):
+        self._ensure_dir()
+        with open(self._path(base_url, username, ".lock"), "a+") as fh:
+            if fcntl is not None:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            elif msvcrt is not None:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+                elif msvcrt is not None:
+                    fh.seek(0)
+                    msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def load(self, base_url: str, username: str) -> Optional[List[Dict[str, Any]]]:
+        p = self._path(base_url, username, ".json")
+        try:
+            data = json.loads(p.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+        now = time.time()
+        if float(data.get("expires_at", 0)) <= now:
+            return None
+        cookies = [c for c in data.get("cookies", []) if not c.get("expires") or float(c["expires"]) > now]
+        return cookies or None
+
+    def save(self, base_url: str, username: str, cookies: Iterable):
+        now = time.time()
+        items = []
+        expires_at = now + self.ttl_sec
+        for c in cookies:
+            items.append({
+                "name": c.name,
+                "value": c.value,
+                "domain": c.domain or "",
+                "path": c.path or "/",
+                "secure": bool(c.secure),
+                "expires": c.expires,
+            })
+            if c.expires:
+                expires_at = min(expires_at, float(c.expires))
+        self._ensure_dir()
+        p = self._path(base_url, username, ".json")
+        tmp = p.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp.unlink()
+        except FileNotFoundError:
+            pass
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump({"created_at": now, "expires_at": expires_at, "cookies": items}, fh)
+        os.replace(tmp, p)
+
+    def invalidate(self, base_url: str, username: str):
+        try:
+            self._path(base_url, username, ".json").unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,92 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..models.snapshot import FieldSnapshot
+
+
+_VOLATILE_ATTR_RE = re.compile(r'\s(?:_ng(?:content|host)-[\w-]+|ng-reflect-[\w-]+|aria-owns|aria-activedescendant)(?:="[^"]*")?')
+_GENERATED_ID_RE = re.compile(r'\b((?:mat|cdk)-[a-z-]*?)-\d+\b')
+_CLASS_ATTR_RE = re.compile(r'\sclass="([^"]*)"')
+_STATE_CLASS_RE = re.compile(
+    r"^(?:ng-(?:touched|untouched|dirty|pristine|valid|invalid|pending|submitted|star-inserted|animating|trigger.*)"
+    r"|mat-(?:focused|active|form-field-should-float|form-field-invalid|selected|ripple.*)"
+    r"|cdk-(?:focused|mouse-focused|keyboard-focused|program-focused|touch-focused))$"
+)
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+_GAP_RE = re.compile(r">\s+<")
+_SPACE_RE = re.compile(r"\s+")
+_SAFE_RE = re.compile(r"[^\w.-]+")
+
+
+def _stable_classes(m) -> str:
+    classes = sorted(c for c in m.group(1).split() if not _STATE_CLASS_RE.match(c))
+    return f' class="{" ".join(classes)}"' if classes else ""
+
+
+def normalize_html(html: Optional[str]) -> str:
+    if not html:
+        return ""
+    s = _COMMENT_RE.sub("", html)
+    s = _CLASS_ATTR_RE.sub(_stable_classes, s)
+    s = _VOLATILE_ATTR_RE.sub("", s)
+    s = _GENERATED_ID_RE.sub(r"\1-#", s)
+    s = _GAP_RE.sub("><", s)
+    return _SPACE_RE.sub(" ", s).strip()
+
+
+def snapshot_record(snap: FieldSnapshot, spec: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    record = {
+        "spec": json.loads(json.dumps(spec or {}, sort_keys=True, default=str)),
+        "found": snap.found,
+        "html": normalize_html(snap.html),
+        "label": snap.label,
+        "readonly": snap.readonly_state,
+        "required": snap.required,
+    }
+    record["hash"] = hashlib.sha256(json.dumps(record, sort_keys=True).encode("utf-8")).hexdigest()
+    return record
+
+
+class SnapshotStore:
+    def __init__(self, path: str = ".creatio_snapshots"):
+        self.dir = Path(path)
+
+    def _path(self, page: str, build: str) -> Path:
+        return self.dir / (_SAFE_RE.sub("_", page) or "page") / f"{_SAFE_RE.sub('_', build) or 'unknown'}.json.gz"
+
+    def load(self, page: str, build: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        try:
+            with gzip.open(self._path(page, build), "rt", encoding="utf-8") as fh:
+                return json.load(fh).get("fields") or {}
+        except Exception:
+            return None
+
+    def save(self, page: str, build: str, fields: Dict[str, Dict[str, Any]]):
+        p = self._path(page, build)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        tmp = p.with_suffix(f".{os.getpid()}.tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as fh:
+            json.dump({"page": page, "build": build, "created_at": time.time(), "fields": fields}, fh, sort_keys=True)
+        os.replace(tmp, p)
+
+
+def diff_records(baseline: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+    out = {}
+    for code, rec in current.items():
+        old = baseline.get(code)
+        if old is None:
+            out[code] = "added"
+        elif old.get("hash") != rec.get("hash"):
+            out[code] = "changed"
+        else:
+            out[code] = "unchanged"
+    for code in baseline:
+        if code not in current:
+            out[code] = "removed"
+    return out
@@ -0,0 +1,115 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models.snapshot import FieldSnapshot
+from .dom_queries import LABEL_SELECTORS, REQUIRED_LABEL_SELECTOR
+
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+
+LOCK_ICON_SELECTOR = '.readonly-icon,[data-mat-icon-name="lock"],[title*="Non-editable"]'
+
+
+def parse_html(html: str):
+    if lxml_html is None:
+        raise ImportError("offline validation requires lxml and cssselect: pip install lxml cssselect")
+    return lxml_html.document_fromstring(html)
+
+
+def _text(node) -> str:
+    return " ".join((node.text_content() or "").split())
+
+
+def _first(node, selector: str):
+    found = node.cssselect(selector)
+    return found[0] if found else None
+
+
+def _attr(node, name: str) -> Optional[str]:
+    return node.get(name)
+
+
+def _label(doc, host) -> str:
+    inp = _first(host, "input, textarea, [role='combobox']")
+    if inp is not None:
+        a = (_attr(inp, "aria-label") or "").strip()
+        if a:
+            return a
+        lb = (_attr(inp, "aria-labelledby") or "").strip()
+        if lb:
+            parts = []
+            for rid in lb.split():
+                refs = doc.xpath("//*[@id=$id]", id=rid)
+                if refs:
+                    t = _text(refs[0])
+                    if t:
+                        parts.append(t)
+            joined = " ".join(parts).strip()
+            if joined:
+                return joined
+    for sel in LABEL_SELECTORS:
+        for node in host.cssselect(sel):
+            t = _text(node)
+            if t:
+                return t
+    return ""
+
+
+def _readonly_state(host) -> Dict[str, Any]:
+    state: Dict[str, Any] = {
+        "hostReadonly": _attr(host, "readonly"),
+        "hostDisabled": _attr(host, "disabled"),
+        "hasLockIcon": _first(host, LOCK_ICON_SELECTOR) is not None,
+        "inputs": [],
+    }
+    for n in host.cssselect("input,textarea,select,[role='combobox']"):
+        state["inputs"].append({
+            "readonlyAttr": _attr(n, "readonly"),
+            "disabledAttr": _attr(n, "disabled"),
+            "ariaReadonly": _attr(n, "aria-readonly"),
+            "ariaDisabled": _attr(n, "aria-disabled"),
+            "readOnlyProp": n.tag in ("input", "textarea") and _attr(n, "readonly") is not None,
+            "disabledProp": _attr(n, "disabled") is not None,
+        })
+    return state
+
+
+def _required(host, ed) -> bool:
+    if ed is not None:
+        if (_attr(ed, "aria-required") or "").strip().lower() == "true":
+            return True
+        if _attr(ed, "required") is not None:
+            return True
+    for le in host.cssselect(REQUIRED_LABEL_SELECTOR):
+        if "crt-input-required" in (_attr(le, "class") or ""):
+            return True
+    return False
+
+
+def field_snapshot(doc, code: str, probe: Optional[str]) -> FieldSnapshot:
+    hosts = doc.xpath("//*[@element-name=$code]", code=code)
+    if not hosts:
+        return FieldSnapshot(code=code, found=False)
+    host = hosts[0]
+    ed = _first(host, "input, textarea")
+    if ed is None:
+        ed = _first(host, "[role='combobox']")
+    box = _first(host, "mat-checkbox input[type='checkbox']")
+    return FieldSnapshot(
+        code=code,
+        found=True,
+        tag=str(host.tag).lower(),
+        control=(_first(host, probe) is not None) if probe else True,
+        label=_label(doc, host),
+        readonly_state=_readonly_state(host),
+        required=_required(host, ed),
+        value=_attr(ed, "value") if ed is not None else None,
+        checked=(_attr(box, "checked") is not None) if box is not None else None,
+    )
+
+
+def collect_static_snapshot(html: str, specs: List[Tuple[str, Optional[str]]]) -> Dict[str, FieldSnapshot]:
+    doc = parse_html(html)
+    return {code: field_snapshot(doc, code, probe) for code, probe in specs}
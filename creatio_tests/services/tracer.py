@@ -0,0 +1,140 @@
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass
+class CommandStat:
+    count: int = 0
+    total_sec: float = 0.0
+    max_sec: float = 0.0
+
+    def add(self, elapsed: float):
+        self.count += 1
+        self.total_sec += elapsed
+        if elapsed > self.max_sec:
+            self.max_sec = elapsed
+
+
+@dataclass
+class TraceSpan:
+    page: str = ""
+    code: str = ""
+    phase: str = ""
+    round_trips: int = 0
+    elapsed_sec: float = 0.0
+    phases: Dict[str, CommandStat] = field(default_factory=dict)
+
+    def add(self, phase: str, elapsed: float):
+        self.round_trips += 1
+        self.elapsed_sec += elapsed
+        self.phases.setdefault(phase or "other", CommandStat()).add(elapsed)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "round_trips": self.round_trips,
+            "elapsed_sec": round(self.elapsed_sec, 4),
+            "phases": {k: {"round_trips": v.count, "elapsed_sec": round(v.total_sec, 4)} for k, v in self.phases.items()},
+        }
+
+
+class CommandTracer:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.commands: Dict[str, CommandStat] = {}
+        self.fields: Dict[Tuple[str, str], CommandStat] = {}
+
+    def install(self, driver):
+        if getattr(driver, "_creatio_tracer", None) is self:
+            return driver
+        original = getattr(driver, "_creatio_untraced_execute", None) or driver.execute
+        driver._creatio_untraced_execute = original
+
+        def execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return original(driver_command, params)
+            finally:
+                self.record(str(driver_command), time.perf_counter() - start)
+
+        driver.execute = execute
+        driver._creatio_tracer = self
+        return driver
+
+    @staticmethod
+    def uninstall(driver):
+        if getattr(driver, "_creatio_untraced_execute", None) is None:
+            return driver
+        vars(driver).pop("execute", None)
+        vars(driver).pop("_creatio_untraced_execute", None)
+        vars(driver).pop("_creatio_tracer", None)
+        return driver
+
+    def _stack(self) -> List[TraceSpan]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    @contextmanager
+    def scope(self, page: Optional[str] = None, code: Optional[str] = None, phase: Optional[str] = None) -> Iterator[TraceSpan]:
+        stack = self._stack()
+        parent = stack[-1] if stack else TraceSpan()
+        span = TraceSpan(
+            page=parent.page if page is None else page,
+            code=parent.code if code is None else code,
+            phase=parent.phase if phase is None else phase,
+        )
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            stack.pop()
+
+    def record(self, command: str, elapsed: float):
+        stack = self._stack()
+        current = stack[-1] if stack else TraceSpan()
+        for span in stack:
+            span.add(current.phase, elapsed)
+        with self._lock:
+            self.commands.setdefault(command, CommandStat()).add(elapsed)
+            if current.code:
+                self.fields.setdefault((current.page, current.code), CommandStat()).add(elapsed)
+
+    def reset(self):
+        with self._lock:
+            self.commands = {}
+            self.fields = {}
+
+    def report(self, top: int = 10) -> Dict[str, Any]:
+        with self._lock:
+            commands = dict(self.commands)
+            fields = dict(self.fields)
+        slowest = sorted(fields.items(), key=lambda kv: kv[1].total_sec, reverse=True)[:top]
+        busiest = sorted(commands.items(), key=lambda kv: kv[1].count, reverse=True)[:top]
+        return {
+            "total_round_trips": sum(s.count for s in commands.values()),
+            "total_sec": round(sum(s.total_sec for s in commands.values()), 4),
+            "slowest_fields": [
+                {"page": k[0], "field": k[1], "round_trips": v.count, "elapsed_sec": round(v.total_sec, 4)}
+                for k, v in slowest
+            ],
+            "top_commands": [
+                {"command": k, "count": v.count, "total_sec": round(v.total_sec, 4), "max_sec": round(v.max_sec, 4)}
+                for k, v in busiest
+            ],
+        }
+
+    def format_report(self, top: int = 10) -> str:
+        r = self.report(top)
+        lines = [f"round trips: {r['total_round_trips']}, time: {r['total_sec']}s", "slowest fields:"]
+        for f in r["slowest_fields"]:
+            lines.append(f"  [{f['page']}][{f['field']}] {f['elapsed_sec']}s in {f['round_trips']} calls")
+        lines.append("top commands:")
+        for c in r["top_commands"]:
+            lines.append(f"  {c['command']}: {c['count']} calls, {c['total_sec']}s (max {c['max_sec']}s)")
+        return "\n".join(lines)
@@ -1,11 +1,68 @@
 import time
-from typing import Callable, Optional
+from typing import Any, Callable
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 
 
-def wait_for_js_ready(driver: WebDriver, timeout: int):
-    deadline = time.time() + timeout
+READY_JS = """
+var done = arguments[arguments.length - 1];
+if (document.readyState === 'complete') { done(true); return; }
+var finished = false;
+function finish(v){
+  if (finished) return;
+  finished = true;
+  document.removeEventListener('readystatechange', onChange);
+  done(v);
+}
+function onChange(){ if (document.readyState === 'complete') finish(true); }
+document.addEventListener('readystatechange', onChange);
+setTimeout(function(){ finish(document.readyState === 'complete'); }, arguments[0]);
+"""
+
+OBSERVE_JS = """
+var done = arguments[arguments.length - 1];
+var timeoutMs = arguments[0];
+var args = Array.prototype.slice.call(arguments, 1, arguments.length - 1);
+function predicate(){
+__PREDICATE__
+}
+var finished = false, obs = null, hard = null;
+function finish(v){
+  if (finished) return;
+  finished = true;
+  if (obs) obs.disconnect();
+  clearTimeout(hard);
+  done(v);
+}
+function probe(){
+  var v = null;
+  try { v = predicate.apply(null, args); } catch (e) { v = null; }
+  if (v) finish(v);
+}
+probe();
+if (!finished) {
+  obs = new MutationObserver(probe);
+  obs.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+  hard = setTimeout(function(){ finish(null); }, timeoutMs);
+}
+"""
+
+
+def ensure_script_timeout(driver: WebDriver, timeout: float):
+    try:
+        current = float(driver.timeouts.script)
+    except Exception:
+        current = 0.0
+    if current < timeout:
+        driver.set_script_timeout(timeout)
+
+
+def wait_for_condition(driver: WebDriver, predicate_js: str, timeout: float, *args) -> Any:
+    ensure_script_timeout(driver, timeout + 5)
+    return driver.execute_async_script(OBSERVE_JS.replace("__PREDICATE__", predicate_js), int(timeout * 1000), *args)
+
+
+def _poll_js_ready(driver: WebDriver, deadline: float) -> bool:
     while time.time() < deadline:
         try:
             if (driver.execute_script("return document.readyState") or "") == "complete":
@@ -16,18 +73,51 @@ def wait_for_js_ready(driver: WebDriver, timeout: int):
     return False
 
 
-def wait_for_css(driver: WebDriver, selector: str, timeout: int) -> bool:
-    deadline = time.time() + timeout
+def _poll_css(driver: WebDriver, selector: str, deadline: float, interval: float = 0.05) -> bool:
     while time.time() < deadline:
         try:
             if driver.find_elements(By.CSS_SELECTOR, selector):
                 return True
         except Exception:
             pass
-        time.sleep(0.05)
+        time.sleep(max(0.0, min(interval, deadline - time.time())))
     return False
 
 
+def wait_for_js_ready(driver: WebDriver, timeout: int):
+    deadline = time.time() + timeout
+    try:
+        ensure_script_timeout(driver, timeout + 5)
+        if driver.execute_async_script(READY_JS, int(timeout * 1000)):
+            return True
+    except Exception:
+        pass
+    return _poll_js_ready(driver, deadline)
+
+
+def wait_for_css(driver: WebDriver, selector: str, timeout: int) -> bool:
+    deadline = time.time() + timeout
+    try:
+        return bool(wait_for_condition(driver, "return !!document.querySelector(arguments[0]);", timeout, selector))
+    except Exception:
+        pass
+    return _poll_css(driver, selector, deadline)
+
+
+def wait_for_element(driver: WebDriver, selector: str, timeout: int, poll_interval: float = 0.05):
+    deadline = time.time() + timeout
+    try:
+        return wait_for_condition(driver, "return document.querySelector(arguments[0]);", timeout, selector)
+    except Exception:
+        pass
+    if _poll_css(driver, selector, deadline, poll_interval):
+        try:
+            return driver.find_element(By.CSS_SELECTOR, selector)
+        except Exception:
+            return None
+    return None
+
+
 def poll_until(fn: Callable[[], bool], timeout: int, interval: float = 0.1) -> bool:
     deadline = time.time() + timeout
     last = False
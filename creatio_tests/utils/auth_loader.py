@@ -3,6 +3,10 @@ from pathlib import Path
 from typing import Optional
 
 from ..page import CreatioAuthPage
+from ..page.auth_page import DEFAULT_SESSION_CHECK_PATH
+from ..page.driver_pool import get_driver_pool
+from ..models.config import DEFAULT_BLOCKED_URLS, LoadProfile
+from ..services.session_cache import SessionCache
 
 
 def _as_bool(x):
@@ -56,7 +60,83 @@ def load_auth(config_path: Optional[str] = None) -> CreatioAuthPage:
     except Exception:
         raise ValueError(f"invalid 'wait_timeout_sec': {wait_timeout_sec!r}")
 
-    return CreatioAuthPage(
+    session_cache = None
+    cache_cfg = data.get("session_cache", None)
+    try:
+        cache_cfg = _as_bool(cache_cfg)
+    except ValueError:
+        pass
+    if cache_cfg is not None and cache_cfg is not False:
+        cache_path = ".creatio_sessions" if cache_cfg is True else str(cache_cfg)
+        ttl = data.get("session_cache_ttl_sec", 3600)
+        try:
+            ttl = int(ttl)
+        except Exception:
+            raise ValueError(f"invalid 'session_cache_ttl_sec': {ttl!r}")
+        session_cache = SessionCache(cache_path, ttl_sec=ttl)
+
+    session_check_path = str(data.get("session_check_path") or DEFAULT_SESSION_CHECK_PATH)
+
+    load_profile = None
+    profile_cfg = data.get("load_profile", None)
+    if profile_cfg is not None:
+        if not isinstance(profile_cfg, dict):
+            raise ValueError(f"invalid 'load_profile': expected object, got {profile_cfg!r}")
+        block_urls = profile_cfg.get("block_urls", [])
+        if not isinstance(block_urls, list):
+            raise ValueError("invalid 'load_profile.block_urls': expected list of URL patterns")
+        try:
+            block_defaults = _as_bool(profile_cfg.get("block_defaults", False))
+            cache_size = profile_cfg.get("disk_cache_size_mb", None)
+            cache_size = int(cache_size) if cache_size is not None else None
+        except ValueError as e:
+            raise ValueError(f"invalid 'load_profile': {e}")
+        load_profile = LoadProfile(
+            block_urls=(list(DEFAULT_BLOCKED_URLS) if block_defaults else []) + [str(u) for u in block_urls],
+            user_data_dir=str(profile_cfg["user_data_dir"]) if profile_cfg.get("user_data_dir") else None,
+            disk_cache_dir=str(profile_cfg["disk_cache_dir"]) if profile_cfg.get("disk_cache_dir") else None,
+            disk_cache_size_mb=cache_size,
+        )
+
+    driver_pool = None
+    prewarm = 0
+    pool_cfg = data.get("browser_pool", None)
+    try:
+        pool_cfg = _as_bool(pool_cfg)
+    except ValueError:
+        pass
+    if pool_cfg is True:
+        pool_cfg = {}
+    if isinstance(pool_cfg, dict):
+        try:
+            driver_pool = get_driver_pool(
+                size=int(pool_cfg.get("size", 2)),
+                max_uses=int(pool_cfg.get("max_uses", 20)),
+                max_idle_sec=int(pool_cfg.get("max_idle_sec", 600)),
+                debug=debug,
+            )
+            prewarm = int(pool_cfg.get("prewarm", 0))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"invalid 'browser_pool': {e}")
+    elif pool_cfg not in (None, False):
+        raise ValueError(f"invalid 'browser_pool': {pool_cfg!r}")
+    if driver_pool is not None and session_cache is None:
+        try:
+            session_cache = SessionCache(ttl_sec=int(data.get("session_cache_ttl_sec", 3600)))
+        except Exception:
+            raise ValueError(f"invalid 'session_cache_ttl_sec': {data.get('session_cache_ttl_sec')!r}")
+
+    trace = data.get("trace", False)
+    try:
+        trace = _as_bool(trace)
+    except ValueError as e:
+        raise ValueError(f"invalid 'trace': {e}")
+
+    reader_backend = str(data.get("reader") or "webdriver").strip().lower()
+    if reader_backend not in ("webdriver", "cdp"):
+        raise ValueError(f"invalid 'reader': {reader_backend!r}, expected 'webdriver' or 'cdp'")
+
+    client = CreatioAuthPage(
         base_url=base_url,
         username=username,
         password=password,
@@ -64,4 +144,15 @@ def load_auth(config_path: Optional[str] = None) -> CreatioAuthPage:
         headless=headless,
         wait_timeout_sec=wait_timeout_sec,
         debug=debug,
+        session_cache=session_cache,
+        session_check_path=session_check_path,
+        driver_pool=driver_pool,
+        odata_path=str(data.get("odata_path") or "/0/odata"),
+        reader_backend=reader_backend,
+        load_profile=load_profile,
     )
+    if trace:
+        client.enable_tracing()
+    if prewarm > 0:
+        client.prewarm_pool(prewarm)
+    return client
@@ -0,0 +1,28 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from ..models.result import ValidationResult
+from .page_loader import load_page_config
+
+
+def validate_html_file(config_path: str, html_path: str) -> Tuple[bool, Dict[str, ValidationResult]]:
+    page = load_page_config(None, config_path)
+    return page.check_html(Path(html_path).read_text(encoding="utf-8"))
+
+
+def validate_html_files(
+    config_path: str,
+    html_paths: Iterable[str],
+    workers: Optional[int] = None,
+) -> Dict[str, Tuple[bool, Dict[str, ValidationResult]]]:
+    paths = [str(p) for p in html_paths]
+    if not paths:
+        return {}
+    workers = max(1, min(len(paths), workers or os.cpu_count() or 1))
+    if workers == 1:
+        return {p: validate_html_file(config_path, p) for p in paths}
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        futures = {p: ex.submit(validate_html_file, config_path, p) for p in paths}
+        return {p: fut.result() for p, fut in futures.items()}
@@ -30,7 +30,7 @@ def _normalize_bool(x):
     return None
 
 
-def load_page_config(client: CreatioAuthPage, config_path: Optional[str] = None) -> PageObject:
+def load_page_config(client: Optional[CreatioAuthPage], config_path: Optional[str] = None) -> PageObject:
     p = Path(config_path or "page.json")
     if not p.exists():
         raise FileNotFoundError(f"config file not found: {str(p)}")
@@ -80,6 +80,18 @@ def load_page_config(client: CreatioAuthPage, config_path: Optional[str] = None)
         if lookup_values is not None and not isinstance(lookup_values, list):
             raise ValueError(f"lookup_values must be list for field {code}")
 
+        lookup_source = f.get("lookup_source", None)
+        if lookup_source is not None:
+            if ftype != FieldType.LOOKUP:
+                raise ValueError(f"lookup_source is only valid for LOOKUP fields, got {ftype.name} for field {code}")
+            if not isinstance(lookup_source, dict) or not str(lookup_source.get("entity", "")).strip():
+                raise ValueError(f"lookup_source must be an object with 'entity' for field {code}")
+            lookup_source = {k: str(v) for k, v in lookup_source.items() if v is not None}
+
+        column = f.get("column", None)
+        if column is not None:
+            column = str(column).strip() or None
+
         per_field_wait = f.get("wait_timeout_sec", None)
         if per_field_wait is not None:
             per_field_wait = int(per_field_wait)
@@ -93,6 +105,8 @@ def load_page_config(client: CreatioAuthPage, config_path: Optional[str] = None)
             required=required,
             lookup_values=lookup_values,
             wait_timeout_sec=per_field_wait,
+            lookup_source=lookup_source,
+            column=column,
         )
 
     return page
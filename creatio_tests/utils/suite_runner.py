@@ -0,0 +1,320 @@
+import json
+import multiprocessing
+import os
+import queue
+import time
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from xml.etree import ElementTree as ET
+
+from ..services.result_sink import JsonlResultSink
+from .auth_loader import load_auth
+from .page_loader import load_page_config
+
+
+DEFAULT_HISTORY_PATH = ".creatio_runs/durations.json"
+DEFAULT_DURATION_SEC = 60.0
+CHECK_MODES = ("await", "check", "snapshot")
+
+
+@dataclass
+class PageJob:
+    page_path: str
+    auth_path: str
+    test_url: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return str(Path(self.page_path).resolve())
+
+
+def find_auth(page_path: Path, default_auth: Optional[str] = None) -> Optional[str]:
+    if default_auth:
+        return default_auth
+    name = page_path.name
+    if name.endswith(".page.json"):
+        sibling = page_path.with_name(name[: -len(".page.json")] + ".auth.json")
+        if sibling.exists():
+            return str(sibling)
+    for d in [page_path.parent, *page_path.parent.parents]:
+        candidate = d / "auth.json"
+        if candidate.exists():
+            return str(candidate)
+    return None
+
+
+def discover(paths: List[str], pattern: str = "*.page.json", default_auth: Optional[str] = None) -> List[PageJob]:
+    jobs: List[PageJob] = []
+    seen = set()
+    for raw in paths or ["."]:
+        p = Path(raw)
+        pages = sorted(p.rglob(pattern)) if p.is_dir() else [p]
+        for page_path in pages:
+            if page_path.resolve() in seen:
+                continue
+            seen.add(page_path.resolve())
+            data = json.loads(page_path.read_text(encoding="utf-8"))
+            auth = data.get("auth")
+            auth = str((page_path.parent / auth)) if auth else find_auth(page_path, default_auth)
+            if not auth:
+                raise FileNotFoundError(f"no auth config found for {page_path}")
+            test_url = data.get("test_url")
+            jobs.append(PageJob(page_path=str(page_path), auth_path=auth, test_url=str(test_url) if test_url else None))
+    return jobs
+
+
+def load_history(path: str) -> Dict[str, float]:
+    try:
+        return {k: float(v) for k, v in json.loads(Path(path).read_text(encoding="utf-8")).items()}
+    except Exception:
+        return {}
+
+
+def save_history(path: str, history: Dict[str, float]):
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = p.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(history, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, p)
+
+
+def plan_shards(jobs: List[PageJob], workers: int, history: Dict[str, float]) -> List[List[PageJob]]:
+    known = [history[j.key] for j in jobs if j.key in history]
+    fallback = sum(known) / len(known) if known else DEFAULT_DURATION_SEC
+    n = max(1, min(workers, len(jobs)))
+    shards: List[List[PageJob]] = [[] for _ in range(n)]
+    loads = [0.0] * n
+    for job in sorted(jobs, key=lambda j: history.get(j.key, fallback), reverse=True):
+        i = loads.index(min(loads))
+        shards[i].append(job)
+        loads[i] += history.get(job.key, fallback)
+    return [s for s in shards if s]
+
+
+def _result_record(r) -> Dict[str, Any]:
+    return {"ok": r.ok, "message": r.message, "details": r.details}
+
+
+def _check_page(client, job: PageJob, mode: str, field_log: Optional[str], record: Dict[str, Any]):
+    page = load_page_config(client, job.page_path)
+    record["name"] = page.name
+    sink = JsonlResultSink(field_log) if field_log else None
+    page.sink = sink
+    try:
+        if mode == "check":
+            ok, results = page.check_all()
+        elif mode == "snapshot":
+            ok, results = page.check_all(use_snapshot=True)
+        else:
+            ok, results = page.await_check_all()
+    finally:
+        if sink is not None:
+            sink.close()
+    record["ok"] = ok
+    record["fields"] = {code: _result_record(r) for code, r in results.items()}
+
+
+def _fail(record: Dict[str, Any], e: Exception):
+    record["ok"] = False
+    record["error"] = f"{type(e).__name__}: {e}"
+    record["traceback"] = traceback.format_exc()
+
+
+def _open_client(job: PageJob):
+    client = load_auth(job.auth_path)
+    try:
+        if job.test_url:
+            client.test_url = job.test_url
+        client.login()
+        client.load_page()
+        client.build_fields_index(one_shot=True)
+    except Exception:
+        client.close()
+        raise
+    return client
+
+
+def _auth_test_url(auth_path: str) -> str:
+    return str(json.loads(Path(auth_path).read_text(encoding="utf-8"))["test_url"])
+
+
+def run_job(job: PageJob, mode: str = "await", field_log: Optional[str] = None) -> Dict[str, Any]:
+    started = time.time()
+    record: Dict[str, Any] = {"page": job.page_path, "auth": job.auth_path, "started_at": started}
+    client = None
+    try:
+        client = _open_client(job)
+        _check_page(client, job, mode, field_log, record)
+    except Exception as e:
+        _fail(record, e)
+    finally:
+        if client is not None:
+            client.close()
+    record["elapsed_sec"] = round(time.time() - started, 3)
+    return record
+
+
+def run_jobs(jobs: List[PageJob], mode: str = "await", field_log: Optional[str] = None, spa: bool = False) -> Iterator[Dict[str, Any]]:
+    if not spa:
+        for job in jobs:
+            yield run_job(job, mode, field_log)
+        return
+    client = None
+    current_auth = None
+    default_urls: Dict[str, str] = {}
+    try:
+        for job in sorted(jobs, key=lambda j: j.auth_path):
+            started = time.time()
+            record: Dict[str, Any] = {"page": job.page_path, "auth": job.auth_path, "started_at": started}
+            try:
+                if client is None or current_auth != job.auth_path:
+                    if client is not None:
+                        client.close()
+                        client = None
+                    client = _open_client(job)
+                    current_auth = job.auth_path
+                    record["navigation"] = "load"
+                else:
+                    if job.auth_path not in default_urls:
+                        default_urls[job.auth_path] = _auth_test_url(job.auth_path)
+                    record["navigation"] = "spa" if client.navigate(job.test_url or default_urls[job.auth_path]) else "reload"
+                _check_page(client, job, mode, field_log, record)
+            except Exception as e:
+                _fail(record, e)
+                if client is not None:
+                    client.close()
+                    client = None
+            record["elapsed_sec"] = round(time.time() - started, 3)
+            yield record
+    finally:
+        if client is not None:
+            client.close()
+
+
+def _run_shard(worker: int, shard: List[PageJob], mode: str, out, field_log: Optional[str] = None, spa: bool = False):
+    for record in run_jobs(shard, mode, field_log, spa):
+        out.put(("page", worker, record))
+    out.put(("done", worker, None))
+
+
+def _record_duration(history: Dict[str, float], record: Dict[str, Any]):
+    if not record.get("error") and "elapsed_sec" in record:
+        history[str(Path(record["page"]).resolve())] = record["elapsed_sec"]
+
+
+class SuiteReport:
+    def __init__(self, report_dir: str, write_interval_sec: float = 30.0):
+        self.dir = Path(report_dir)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.pages: List[Dict[str, Any]] = []
+        self.started_at = time.time()
+        self.write_interval_sec = write_interval_sec
+        self._written_at = self.started_at
+        for stale in self.dir.glob("fields.*.jsonl*"):
+            stale.unlink()
+        self._stream = open(self.dir / "results.jsonl", "w", encoding="utf-8")
+
+    def add(self, record: Dict[str, Any]):
+        self.pages.append(record)
+        self._stream.write(json.dumps(record, default=str) + "\n")
+        self._stream.flush()
+        if self.write_interval_sec and time.time() - self._written_at >= self.write_interval_sec:
+            self.write()
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "started_at": self.started_at,
+            "elapsed_sec": round(time.time() - self.started_at, 3),
+            "pages": len(self.pages),
+            "failed_pages": sum(1 for p in self.pages if not p.get("ok")),
+            "ok": all(p.get("ok") for p in self.pages),
+        }
+
+    def _replace(self, name: str, data: bytes):
+        p = self.dir / name
+        tmp = p.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, p)
+
+    def junit(self) -> ET.Element:
+        root = ET.Element("testsuites")
+        for p in self.pages:
+            fields = p.get("fields") or {}
+            failures = sum(1 for f in fields.values() if not f["ok"])
+            suite = ET.SubElement(root, "testsuite", {
+                "name": str(p.get("name") or p["page"]),
+                "tests": str(len(fields) + (1 if p.get("error") else 0) or 1),
+                "failures": str(failures),
+                "errors": "1" if p.get("error") else "0",
+                "time": str(p.get("elapsed_sec", 0)),
+            })
+            if p.get("error"):
+                case = ET.SubElement(suite, "testcase", {"classname": suite.get("name"), "name": "page"})
+                ET.SubElement(case, "error", {"message": p["error"]}).text = p.get("traceback", "")
+            for code, f in fields.items():
+                case = ET.SubElement(suite, "testcase", {"classname": suite.get("name"), "name": code})
+                if not f["ok"]:
+                    ET.SubElement(case, "failure", {"message": f["message"]}).text = json.dumps(f["details"], default=str)
+        return root
+
+    def write(self):
+        self._written_at = time.time()
+        self._replace("report.json", json.dumps({"summary": self.summary(), "pages": self.pages}, indent=2, default=str).encode("utf-8"))
+        self._replace("junit.xml", ET.tostring(self.junit(), encoding="utf-8", xml_declaration=True))
+
+    def close(self):
+        self.write()
+        self._stream.close()
+
+
+def run_suite(
+    jobs: List[PageJob],
+    workers: int = 1,
+    mode: str = "await",
+    report_dir: str = "creatio_report",
+    history_path: str = DEFAULT_HISTORY_PATH,
+    on_page=None,
+    spa: bool = False,
+) -> Dict[str, Any]:
+    if mode not in CHECK_MODES:
+        raise ValueError(f"unknown mode {mode!r}, expected one of {CHECK_MODES}")
+    history = load_history(history_path)
+    shards = plan_shards(jobs, workers, history)
+    report = SuiteReport(report_dir)
+    try:
+        if len(shards) == 1:
+            for record in run_jobs(shards[0], mode, str(report.dir / "fields.0.jsonl"), spa):
+                report.add(record)
+                _record_duration(history, record)
+                if on_page:
+                    on_page(record)
+        else:
+            out = multiprocessing.Queue()
+            procs = {i: multiprocessing.Process(target=_run_shard, args=(i, shard, mode, out, str(report.dir / f"fields.{i}.jsonl"), spa), daemon=True) for i, shard in enumerate(shards)}
+            for proc in procs.values():
+                proc.start()
+            running = set(procs)
+            while running:
+                try:
+                    kind, worker, record = out.get(timeout=1.0)
+                except queue.Empty:
+                    for i in list(running):
+                        if not procs[i].is_alive():
+                            running.discard(i)
+                            report.add({"page": f"<worker {i}>", "ok": False, "error": f"worker exited with code {procs[i].exitcode}"})
+                    continue
+                if kind == "done":
+                    running.discard(worker)
+                    continue
+                report.add(record)
+                _record_duration(history, record)
+                if on_page:
+                    on_page(record)
+            for proc in procs.values():
+                proc.join()
+    finally:
+        report.close()
+        save_history(history_path, history)
+    return report.summary()